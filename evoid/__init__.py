@@ -7,21 +7,12 @@ hybrid orchestration, self-healing proxies, dynamic discovery, and intelligent c
 Version 0.2.3_Beta - Public beta release
 """
 
+import importlib
+
 __version__ = "0.2.3_Beta"
 
-# Export core components
-from .core import (
-    service, Service, get, post, put, delete, patch, head, options, endpoint,
-    Controller, GET, POST, PUT, DELETE, PATCH, HEAD, OPTIONS, Intent, Param, Query, Body,
-    proxy, data_io, data_intent, inject, inject_from_annotation, override, reset_overrides, scheduler,
-    PriorityLevel, get_priority_queue, initialize_queue,
-    auth, AuthManager, AuthConfig, CIAClassification,
-    inject_with_health_check, get_health_registry, get_service_health,
-    BaseProvider, SQLiteStorageProvider, MemoryStorageProvider,
-    Intent, IntentRegistry, get_intent_registry, extract_intents, get_field_intent, model_intent_score,
-    analyze_schema_intent,
-    DataIO, get_data_io, CircuitBreaker, EmergencySafetyBuffer, BackgroundSyncManager
-)
+# Core components are re-exported lazily from ``evoid.core`` so that importing
+# the package does not eagerly load FastAPI, uvicorn and the rest of the stack.
 
 __all__ = [
     "service", "Service", "get", "post", "put", "delete", "patch", "head", "options", "endpoint",
@@ -31,7 +22,22 @@ __all__ = [
     "auth", "AuthManager", "AuthConfig", "CIAClassification",
     "inject_with_health_check", "get_health_registry", "get_service_health",
     "BaseProvider", "SQLiteStorageProvider", "MemoryStorageProvider",
-    "Intent", "IntentRegistry", "get_intent_registry", "extract_intents", "get_field_intent", "model_intent_score",
+    "IntentRegistry", "get_intent_registry", "extract_intents", "get_field_intent", "model_intent_score",
     "analyze_schema_intent",
     "DataIO", "get_data_io", "CircuitBreaker", "EmergencySafetyBuffer", "BackgroundSyncManager"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    if name != "core" and name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    core = importlib.import_module(".core", __name__)
+    if name == "core":
+        return core
+    value = getattr(core, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
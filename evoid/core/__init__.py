@@ -8,36 +8,178 @@ This module exports all core components of the Evox framework including:
 - Dependency injection utilities
 - Scheduler for background tasks
 - Priority queue for request management
+
+Exports are resolved lazily (PEP 562): the submodule that defines a name is
+only imported the first time that name is accessed, so ``import evoid`` does
+not pull in FastAPI, uvicorn, the scheduler, the intent system, etc. until
+they are actually used.
 """
 
-from .application.service_builder import service, Service, get, post, put, delete, patch, head, options, endpoint, Controller, GET, POST, PUT, DELETE, PATCH, HEAD, OPTIONS, Intent, Param, Query, Body
-from .communication.proxy import proxy
-from .data.data_io import data_io
-from .data.intents.intent_system import Intent as data_intent
-from .infrastructure.dependency_injection.injector import inject, override, reset_overrides, inject_from_annotation, inject_with_health_check, get_health_registry, get_service_health
-from .infrastructure.scheduler.task_scheduler import scheduler
-from .infrastructure.queue.priority_queue import PriorityLevel, get_priority_queue, initialize_queue
-from .infrastructure.auth.auth_manager import auth, AuthManager, AuthConfig, CIAClassification
-from .monitoring.intelligence.environmental_intelligence import EnvironmentalIntelligence, get_environmental_intelligence, auto_adjust_concurrency, understand_data_importance, understand_requester_context, get_current_context_status, SystemStatus
-from .data.storage.providers.base_provider import BaseProvider
-from .data.storage.registry import SQLiteStorageProvider, MemoryStorageProvider, ServiceRegistry, service_registry, initialize_service_registry
-from .data.intents.intent_system import Intent, IntentRegistry, get_intent_registry, extract_intents, get_field_intent, model_intent_score
-from .monitoring.intelligence.environmental_intelligence import analyze_schema_intent
-from .data.data_io import DataIO, get_data_io, CircuitBreaker, EmergencySafetyBuffer, BackgroundSyncManager
-from .utilities.serialization.fury_codec import fury_codec, serialize_object, deserialize_object
-from .mapping.model_mapper import model_mapper, map_models, register_mapper, get_mapper, map_api_to_core, map_core_to_api
-from .communication.message_bus import message_bus, get_event_bus, publish_message, subscribe_to_messages, on_message
-from .infrastructure.scheduler.task_scheduler import task_manager, get_task_manager, run_in_background, submit_background_task, schedule_delayed, schedule_recurring, schedule_task, background_task, scheduled_task
-from .utilities.caching.cache_layer import cache_layer, get_cache, cache_get, cache_set, cache_delete, cached
-from .monitoring.metrics.performance_tracker import performance_bench, get_benchmark, run_benchmark, generate_benchmark_report, benchmark_serialization, benchmark_latency, benchmark_throughput
+import importlib
+
+# Public name -> (submodule, attribute). Aliases simply point at a different
+# attribute name in the same submodule.
+_LAZY: dict[str, tuple[str, str]] = {
+    # Service builder
+    "service": (".application.service_builder", "service"),
+    "Service": (".application.service_builder", "Service"),
+    "get": (".application.service_builder", "get"),
+    "post": (".application.service_builder", "post"),
+    "put": (".application.service_builder", "put"),
+    "delete": (".application.service_builder", "delete"),
+    "patch": (".application.service_builder", "patch"),
+    "head": (".application.service_builder", "head"),
+    "options": (".application.service_builder", "options"),
+    "endpoint": (".application.service_builder", "endpoint"),
+    "Controller": (".application.service_builder", "Controller"),
+    "GET": (".application.service_builder", "GET"),
+    "POST": (".application.service_builder", "POST"),
+    "PUT": (".application.service_builder", "PUT"),
+    "DELETE": (".application.service_builder", "DELETE"),
+    "PATCH": (".application.service_builder", "PATCH"),
+    "HEAD": (".application.service_builder", "HEAD"),
+    "OPTIONS": (".application.service_builder", "OPTIONS"),
+    "Param": (".application.service_builder", "Param"),
+    "Query": (".application.service_builder", "Query"),
+    "Body": (".application.service_builder", "Body"),
+    # Communication
+    "proxy": (".communication.proxy", "proxy"),
+    "message_bus": (".communication.message_bus", "message_bus"),
+    "get_event_bus": (".communication.message_bus", "get_event_bus"),
+    "publish_message": (".communication.message_bus", "publish_message"),
+    "subscribe_to_messages": (".communication.message_bus", "subscribe_to_messages"),
+    "on_message": (".communication.message_bus", "on_message"),
+    "event_bus": (".communication.messaging.message_bus", "event_bus"),
+    "publish_event": (".communication.messaging.message_bus", "publish_event"),
+    "subscribe_to_events": (".communication.messaging.message_bus", "subscribe_to_events"),
+    "get_internal_event_bus": (".communication.messaging.message_bus", "get_event_bus"),
+    "on_event": (".communication.messaging.message_bus", "on_event"),
+    # Data IO
+    "data_io": (".data.data_io", "data_io"),
+    "DataIO": (".data.data_io", "DataIO"),
+    "get_data_io": (".data.data_io", "get_data_io"),
+    "CircuitBreaker": (".data.data_io", "CircuitBreaker"),
+    "EmergencySafetyBuffer": (".data.data_io", "EmergencySafetyBuffer"),
+    "BackgroundSyncManager": (".data.data_io", "BackgroundSyncManager"),
+    "start_data_io_background_sync": (".data.data_io", "start_data_io_background_sync"),
+    # Intents
+    "Intent": (".data.intents.intent_system", "Intent"),
+    "data_intent": (".data.intents.intent_system", "Intent"),
+    "IntentRegistry": (".data.intents.intent_system", "IntentRegistry"),
+    "get_intent_registry": (".data.intents.intent_system", "get_intent_registry"),
+    "extract_intents": (".data.intents.intent_system", "extract_intents"),
+    "get_field_intent": (".data.intents.intent_system", "get_field_intent"),
+    "model_intent_score": (".data.intents.intent_system", "model_intent_score"),
+    # Dependency injection
+    "inject": (".infrastructure.dependency_injection.injector", "inject"),
+    "override": (".infrastructure.dependency_injection.injector", "override"),
+    "reset_overrides": (".infrastructure.dependency_injection.injector", "reset_overrides"),
+    "inject_from_annotation": (".infrastructure.dependency_injection.injector", "inject_from_annotation"),
+    "inject_with_health_check": (".infrastructure.dependency_injection.injector", "inject_with_health_check"),
+    "get_health_registry": (".infrastructure.dependency_injection.injector", "get_health_registry"),
+    "get_service_health": (".infrastructure.dependency_injection.injector", "get_service_health"),
+    # Scheduler
+    "scheduler": (".infrastructure.scheduler.task_scheduler", "scheduler"),
+    "task_manager": (".infrastructure.scheduler.task_scheduler", "task_manager"),
+    "get_task_manager": (".infrastructure.scheduler.task_scheduler", "get_task_manager"),
+    "run_in_background": (".infrastructure.scheduler.task_scheduler", "run_in_background"),
+    "submit_background_task": (".infrastructure.scheduler.task_scheduler", "submit_background_task"),
+    "schedule_delayed": (".infrastructure.scheduler.task_scheduler", "schedule_delayed"),
+    "schedule_recurring": (".infrastructure.scheduler.task_scheduler", "schedule_recurring"),
+    "schedule_task": (".infrastructure.scheduler.task_scheduler", "schedule_task"),
+    "background_task": (".infrastructure.scheduler.task_scheduler", "background_task"),
+    "scheduled_task": (".infrastructure.scheduler.task_scheduler", "scheduled_task"),
+    # Priority queue
+    "PriorityLevel": (".infrastructure.queue.priority_queue", "PriorityLevel"),
+    "get_priority_queue": (".infrastructure.queue.priority_queue", "get_priority_queue"),
+    "initialize_queue": (".infrastructure.queue.priority_queue", "initialize_queue"),
+    # Auth
+    "auth": (".infrastructure.auth.auth_manager", "auth"),
+    "AuthManager": (".infrastructure.auth.auth_manager", "AuthManager"),
+    "AuthConfig": (".infrastructure.auth.auth_manager", "AuthConfig"),
+    "CIAClassification": (".infrastructure.auth.auth_manager", "CIAClassification"),
+    # Environmental intelligence
+    "EnvironmentalIntelligence": (".monitoring.intelligence.environmental_intelligence", "EnvironmentalIntelligence"),
+    "get_environmental_intelligence": (".monitoring.intelligence.environmental_intelligence", "get_environmental_intelligence"),
+    "auto_adjust_concurrency": (".monitoring.intelligence.environmental_intelligence", "auto_adjust_concurrency"),
+    "understand_data_importance": (".monitoring.intelligence.environmental_intelligence", "understand_data_importance"),
+    "understand_requester_context": (".monitoring.intelligence.environmental_intelligence", "understand_requester_context"),
+    "get_current_context_status": (".monitoring.intelligence.environmental_intelligence", "get_current_context_status"),
+    "SystemStatus": (".monitoring.intelligence.environmental_intelligence", "SystemStatus"),
+    "analyze_schema_intent": (".monitoring.intelligence.environmental_intelligence", "analyze_schema_intent"),
+    # Storage
+    "BaseProvider": (".data.storage.providers.base_provider", "BaseProvider"),
+    "SQLiteStorageProvider": (".data.storage.registry", "SQLiteStorageProvider"),
+    "MemoryStorageProvider": (".data.storage.registry", "MemoryStorageProvider"),
+    "ServiceRegistry": (".data.storage.registry", "ServiceRegistry"),
+    "service_registry": (".data.storage.registry", "service_registry"),
+    "initialize_service_registry": (".data.storage.registry", "initialize_service_registry"),
+    # Serialization
+    "fury_codec": (".utilities.serialization.fury_codec", "fury_codec"),
+    "serialize_object": (".utilities.serialization.fury_codec", "serialize_object"),
+    "deserialize_object": (".utilities.serialization.fury_codec", "deserialize_object"),
+    "serializer": (".utilities.serialization.fury_codec", "fury_codec"),
+    "core_serialize_object": (".utilities.serialization.fury_codec", "serialize_object"),
+    "core_deserialize_object": (".utilities.serialization.fury_codec", "deserialize_object"),
+    # Model mapping
+    "model_mapper": (".mapping.model_mapper", "model_mapper"),
+    "map_models": (".mapping.model_mapper", "map_models"),
+    "register_mapper": (".mapping.model_mapper", "register_mapper"),
+    "get_mapper": (".mapping.model_mapper", "get_mapper"),
+    "map_api_to_core": (".mapping.model_mapper", "map_api_to_core"),
+    "map_core_to_api": (".mapping.model_mapper", "map_core_to_api"),
+    "core_model_mapper": (".mapping.model_mapper", "model_mapper"),
+    "core_register_mapper": (".mapping.model_mapper", "register_mapper"),
+    "core_get_mapper": (".mapping.model_mapper", "get_mapper"),
+    # Caching
+    "cache_layer": (".utilities.caching.cache_layer", "cache_layer"),
+    "get_cache": (".utilities.caching.cache_layer", "get_cache"),
+    "cache_get": (".utilities.caching.cache_layer", "cache_get"),
+    "cache_set": (".utilities.caching.cache_layer", "cache_set"),
+    "cache_delete": (".utilities.caching.cache_layer", "cache_delete"),
+    "cached": (".utilities.caching.cache_layer", "cached"),
+    # Benchmarking
+    "performance_bench": (".monitoring.metrics.performance_tracker", "performance_bench"),
+    "get_benchmark": (".monitoring.metrics.performance_tracker", "get_benchmark"),
+    "run_benchmark": (".monitoring.metrics.performance_tracker", "run_benchmark"),
+    "generate_benchmark_report": (".monitoring.metrics.performance_tracker", "generate_benchmark_report"),
+    "benchmark_serialization": (".monitoring.metrics.performance_tracker", "benchmark_serialization"),
+    "benchmark_latency": (".monitoring.metrics.performance_tracker", "benchmark_latency"),
+    "benchmark_throughput": (".monitoring.metrics.performance_tracker", "benchmark_throughput"),
+    # Errors
+    "BaseError": (".errors.BaseError", "BaseError"),
+    "ValidationError": (".errors.BaseError", "ValidationError"),
+    "StorageError": (".errors.BaseError", "StorageError"),
+    "IntentError": (".errors.BaseError", "IntentError"),
+    "CommunicationError": (".errors.BaseError", "CommunicationError"),
+    "ConfigurationError": (".errors.BaseError", "ConfigurationError"),
+    "LifecycleError": (".errors.BaseError", "LifecycleError"),
+    # Persistence
+    "IntentRouter": (".data.persistence.intent_router", "IntentRouter"),
+    "PersistenceGateway": (".data.persistence.intent_router", "PersistenceGateway"),
+    "DatabaseServiceManager": (".data.persistence.intent_router", "DatabaseServiceManager"),
+    "persistence_gateway": (".data.persistence.intent_router", "persistence_gateway"),
+    "save_model": (".data.persistence.intent_router", "save_model"),
+    "get_model": (".data.persistence.intent_router", "get_model"),
+    "delete_model": (".data.persistence.intent_router", "delete_model"),
+    "query_models": (".data.persistence.intent_router", "query_models"),
+}
+
+
+def __getattr__(name: str):
+    """Import the submodule that defines ``name`` on first access and cache the result."""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
 
-# New modules added
-from .errors.BaseError import BaseError, ValidationError, StorageError, IntentError, CommunicationError, ConfigurationError, LifecycleError
-from .mapping.model_mapper import model_mapper as core_model_mapper, map_api_to_core, map_core_to_api, register_mapper as core_register_mapper, get_mapper as core_get_mapper
-from .utilities.serialization.fury_codec import fury_codec as serializer, serialize_object as core_serialize_object, deserialize_object as core_deserialize_object
-from .communication.messaging.message_bus import event_bus, publish_event, subscribe_to_events, get_event_bus as get_internal_event_bus, on_event
-from .data.persistence.intent_router import IntentRouter, PersistenceGateway, DatabaseServiceManager, persistence_gateway
-from .data.persistence.intent_router import save_model, get_model, delete_model, query_models
 
 __all__ = [
     "service", 
@@ -90,7 +232,6 @@ __all__ = [
     "ServiceRegistry",
     "service_registry",
     "initialize_service_registry",
-    "Intent",
     "IntentRegistry",
     "get_intent_registry",
     "extract_intents",
@@ -147,8 +288,6 @@ __all__ = [
     "ConfigurationError",
     "LifecycleError",
     "core_model_mapper",
-    "map_api_to_core",
-    "map_core_to_api",
     "core_register_mapper",
     "core_get_mapper",
     "serializer",
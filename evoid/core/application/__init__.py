@@ -1,7 +1,36 @@
-# Application module exports
-from .service_builder import service, Service, get, post, put, delete, patch, head, options, endpoint, Controller, GET, POST, PUT, DELETE, PATCH, HEAD, OPTIONS, Intent, Param, Query, Body
-from .project_manager import get_project_manager, ProjectManager
-from .orchestrator import get_orchestrator, Orchestrator
+# Application module exports, resolved lazily so that importing the service
+# builder does not also pull in the orchestrator (FastAPI, uvicorn) or the
+# project manager (TOML tooling).
+import importlib
+
+_LAZY: dict[str, str] = {
+    **dict.fromkeys(
+        [
+            "service", "Service", "get", "post", "put", "delete", "patch", "head", "options", "endpoint",
+            "Controller", "GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS", "Intent", "Param", "Query", "Body",
+        ],
+        ".service_builder",
+    ),
+    "get_project_manager": ".project_manager",
+    "ProjectManager": ".project_manager",
+    "get_orchestrator": ".orchestrator",
+    "Orchestrator": ".orchestrator",
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     "service", "Service", "get", "post", "put", "delete", "patch", "head", "options", "endpoint",
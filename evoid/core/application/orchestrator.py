@@ -6,11 +6,25 @@ It operates as a pure observer-coordinator with no mandatory control functions.
 """
 
 import os
-import importlib
+import asyncio
+import sys
+import logging
+import functools
+import importlib.machinery
+import importlib.util
+import threading
+from contextlib import asynccontextmanager
+from hashlib import blake2b
 from pathlib import Path
-from typing import Any
-from fastapi import FastAPI
-import uvicorn
+from types import ModuleType
+from typing import Any, TYPE_CHECKING
+
+# FastAPI and uvicorn are only needed once the orchestrator actually boots,
+# so they are imported inside initialize()/run() rather than at module scope.
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
+logger = logging.getLogger(__name__)
 
 
 class Orchestrator:
@@ -18,86 +32,219 @@ class Orchestrator:
     
     def __init__(self):
         self.services: dict[str, Any] = {}
-        self.app: FastAPI | None = None
+        self.app: "FastAPI | None" = None
+        self.dev = False
+        # Modules already imported, keyed by absolute main.py path, so that
+        # re-running discover_services() reuses them instead of re-importing
+        self._loaded: dict[str, ModuleType] = {}
+        # Route response bodies are built once; /services is rebuilt only when
+        # the set of services changes, tracked by _services_version
+        self._health_body = {"status": "healthy", "orchestrator": "running"}
+        self._services_version = 0
+        # (version, body, ETag); the ETag is derived from the service names so
+        # it is identical across workers and restarts
+        self._services_body: tuple[int, dict[str, Any], str] | None = None
     
     async def initialize(self):
         """Initialize the orchestrator with generic platform app"""
+        from fastapi import FastAPI
+        from fastapi.responses import JSONResponse, ORJSONResponse
+
+        # orjson encodes responses in native code; fall back to the stdlib
+        # encoder if it isn't installed
+        self._response_class = ORJSONResponse if importlib.util.find_spec("orjson") else JSONResponse
+        
+        @asynccontextmanager
+        async def lifespan(app):
+            # Discover services before accepting traffic. In production every
+            # service is also imported up front (concurrently) so the first
+            # request doesn't pay for it; in dev they are imported on first use.
+            self.discover_services()
+            if not self.dev:
+                await self.preload_services()
+            yield
+        
         # Initialize with minimal app - no external dependencies
-        self.app = FastAPI(title="Evox Orchestrator")
+        self.app = FastAPI(
+            title="Evox Orchestrator",
+            lifespan=lifespan,
+            default_response_class=self._response_class,
+        )
         self._setup_routes()
     
     def _setup_routes(self):
         """Setup orchestrator routes"""
+        from fastapi import Request, Response
         
         @self.app.get("/health")
         async def health_check():
-            return {"status": "healthy", "orchestrator": "running"}
+            return self._health_body
         
         @self.app.get("/services")
-        async def list_services():
-            return {"services": list(self.services.keys())}
+        async def list_services(request: Request):
+            body, etag = self._get_services_body()
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304, headers={"ETag": etag})
+            return self._response_class(body, headers={"ETag": etag})
+    
+    def _get_services_body(self) -> tuple[dict[str, Any], str]:
+        """Return the /services payload and its ETag, rebuilt only after the registry changed"""
+        cached = self._services_body
+        if cached is None or cached[0] != self._services_version:
+            names = tuple(self.services)
+            digest = blake2b("\n".join(sorted(names)).encode(), digest_size=16).hexdigest()
+            cached = (self._services_version, {"services": names}, f'"{digest}"')
+            self._services_body = cached
+        return cached[1], cached[2]
     
     def discover_services(self, services_dir: str = "services"):
         """Discover services in the services directory"""
         services_path = Path(services_dir)
         if not services_path.exists():
-            print(f"Services directory {services_dir} not found")
+            logger.warning("Services directory %s not found", services_dir)
             return
         
-        for service_dir in services_path.iterdir():
-            if service_dir.is_dir() and not service_dir.name.startswith('.'):
-                self._load_service(service_dir)
+        # scandir entries carry their type, avoiding a stat per is_dir() check
+        with os.scandir(services_path) as entries:
+            for entry in entries:
+                if entry.is_dir() and not entry.name.startswith('.'):
+                    self._load_service(Path(entry.path))
     
     def _load_service(self, service_dir: Path):
-        """Load a service from its directory"""
+        """Register a service from its directory; its module is imported lazily"""
         service_name = service_dir.name
         main_file = service_dir / "main.py"
         
         if not main_file.exists():
-            print(f"Service {service_name} has no main.py file")
+            logger.warning("Service %s has no main.py file", service_name)
             return
         
-        try:
-            # Add services directory to path
-            services_parent = str(service_dir.parent)
-            if services_parent not in os.sys.path:
-                os.sys.path.insert(0, services_parent)
-            
-            # Import service module
-            module_name = f"services.{service_name}.main"
-            service_module = importlib.import_module(module_name)
-            
-            # Store service info
-            self.services[service_name] = {
-                "module": service_module,
-                "path": str(service_dir)
-            }
-            
-            print(f"✅ Loaded service: {service_name}")
-            
-        except Exception as e:
-            print(f"❌ Failed to load service {service_name}: {e}")
+        # Loaded straight from its file under a private namespace, so
+        # sys.path is never extended with the services directory
+        module_name = f"evoid_services.{service_name}.main"
+        main_file = main_file.absolute()
+        if service_name not in self.services:
+            self._services_version += 1
+        self.services[service_name] = {
+            "module": self._loaded.get(str(main_file)),
+            "path": str(service_dir),
+            "_module_loader": functools.partial(_import_service_module, module_name, main_file),
+        }
+    
+    def get_service_module(self, service_name: str):
+        """Return a discovered service's module, importing it on first access"""
+        info = self.services[service_name]
+        if info["module"] is None:
+            try:
+                module = info["_module_loader"]()
+                info["module"] = self._loaded[module.__file__] = module
+                logger.info("Loaded service: %s", service_name)
+            except Exception:
+                logger.exception("Failed to load service %s", service_name)
+                raise
+        return info["module"]
+    
+    async def preload_services(self):
+        """Import all not-yet-loaded services concurrently in worker threads"""
+        pending = [name for name, info in self.services.items() if info["module"] is None]
+        await asyncio.gather(
+            *(asyncio.to_thread(self.get_service_module, name) for name in pending),
+            return_exceptions=True,
+        )
     
     async def run(self, port: int = 8000, dev: bool = False):
         """Run the orchestrator"""
+        import uvicorn
+
+        self.dev = dev
         await self.initialize()
-        self.discover_services()
         
-        if dev:
-            uvicorn.run(
-                self.app,
-                host="0.0.0.0",
-                port=port,
-                reload=True,
-                log_level="debug"
+        # run() is awaited from an already running event loop, so the server is
+        # driven with Server.serve() rather than uvicorn.run(), which would try
+        # to start a second loop. Auto-reload and multiple workers need an
+        # import string rather than an app instance and are left to the CLI.
+        config = uvicorn.Config(
+            self.app,
+            host="0.0.0.0",
+            port=port,
+            log_level="debug" if dev else "info",
+            **_uvicorn_speedups(),
+        )
+        await uvicorn.Server(config).serve()
+
+
+def _uvicorn_speedups() -> dict[str, str]:
+    """Select uvloop and httptools when installed (both ship with uvicorn[standard])"""
+    return {
+        "loop": "uvloop" if importlib.util.find_spec("uvloop") else "auto",
+        "http": "httptools" if importlib.util.find_spec("httptools") else "auto",
+    }
+
+
+# Guards creation of the synthetic parent packages when services are
+# preloaded concurrently from worker threads
+_PACKAGE_LOCK = threading.Lock()
+
+
+def _ensure_service_package(package_name: str, service_dir: Path) -> ModuleType:
+    """
+    Register the parent packages of a service's main module.
+    
+    ``evoid_services`` is an empty container; ``evoid_services.<name>``
+    searches the service directory, so relative imports in main.py resolve
+    against sibling modules. A service __init__.py is executed if present.
+    """
+    with _PACKAGE_LOCK:
+        root_name = package_name.rpartition(".")[0]
+        if root_name not in sys.modules:
+            root_spec = importlib.machinery.ModuleSpec(root_name, None, is_package=True)
+            root_spec.submodule_search_locations = []
+            sys.modules[root_name] = importlib.util.module_from_spec(root_spec)
+        
+        package = sys.modules.get(package_name)
+        search_path = [str(service_dir)]
+        if package is not None and list(getattr(package, "__path__", ())) == search_path:
+            return package
+        
+        init_file = service_dir / "__init__.py"
+        if init_file.exists():
+            spec = importlib.util.spec_from_file_location(
+                package_name, init_file, submodule_search_locations=search_path
             )
         else:
-            uvicorn.run(
-                self.app,
-                host="0.0.0.0",
-                port=port,
-                log_level="info"
-            )
+            spec = importlib.machinery.ModuleSpec(package_name, None, is_package=True)
+            spec.submodule_search_locations = search_path
+        package = importlib.util.module_from_spec(spec)
+        sys.modules[package_name] = package
+        try:
+            if spec.loader is not None:
+                spec.loader.exec_module(package)
+        except BaseException:
+            sys.modules.pop(package_name, None)
+            raise
+        setattr(sys.modules[root_name], package_name.rpartition(".")[2], package)
+        return package
+
+
+def _import_service_module(module_name: str, main_file: Path):
+    """Import a service's main.py by file location without touching sys.path"""
+    module = sys.modules.get(module_name)
+    if module is not None and getattr(module, "__file__", None) == str(main_file):
+        return module
+    
+    package_name = module_name.rpartition(".")[0]
+    package = _ensure_service_package(package_name, main_file.parent)
+    
+    spec = importlib.util.spec_from_file_location(module_name, main_file)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(module_name, None)
+        raise
+    package.main = module
+    return module
 
 
 # Global orchestrator instance
@@ -5,74 +5,27 @@ This module provides the core logic for project and service management,
 including dependency resolution, status tracking, and service discovery.
 """
 
+import ast
+import asyncio
+import importlib.util
+import logging
 import os
-import sys
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any
-import tomli
-import tomli_w
 from enum import Enum
-import asyncio
-
-
-class ProjectStatus(Enum):
-    """Status of a project"""
-    ACTIVE = "active"
-    INACTIVE = "inactive"
-    CORRUPT = "corrupt"
-
+from string import Template
 
-class ServiceStatus(Enum):
-    """Status of a service"""
-    INSTALLED = "installed"
-    MISSING_DEPS = "missing_deps"
-    INACTIVE = "inactive"
+logger = logging.getLogger(__name__)
 
 
-class ProjectManager:
-    """
-    Project Manager - Core logic for managing EVOX projects and services
-    
-    Handles project creation, service management, and dependency resolution
-    without any CLI-specific logic.
-    """
-    
-    def __init__(self, project_root: Path | None = None):
-        self.project_root = project_root or Path.cwd()
-        self._config_cache: Dict[str, Any] = {}
-    
-    def create_project(self, name: str, project_path: Path | None = None) -> bool:
-        """
-        Create a new EVOX project with the specified name.
-        
-        Args:
-            name: Name of the project
-            project_path: Path where the project should be created (defaults to current directory)
-            
-        Returns:
-            True if project was created successfully, False otherwise
-        """
-        target_path = project_path or Path.cwd() / name
-        
-        if target_path.exists():
-            print(f"Project directory '{target_path}' already exists!")
-            return False
-        
-        # Create project structure
-        target_path.mkdir(parents=True)
-        
-        # Create basic project files
-        (target_path / "services").mkdir()
-        (target_path / "plugins").mkdir()
-        
-        # Create pyproject.toml with Rye configuration
-        pyproject_content = f'''[project]
-name = "{name}"
+# Scaffolding templates, compiled once and shared by every create_* call.
+_PYPROJECT_TMPL = Template('''[project]
+name = "$name"
 version = "0.1.0"
 description = "EVOID microservices project - Rye-Native"
 authors = [
-    {{ name = "Developer", email = "dev@example.com" }}
+    { name = "Developer", email = "dev@example.com" }
 ]
 dependencies = [
     "evoid>=0.2.3_Beta",
@@ -112,14 +65,13 @@ packages = ["services", "plugins"]
 dev = "evo run --dev"
 health = "evo health"
 test = "evo test"
-'''
-        
-        (target_path / "pyproject.toml").write_text(pyproject_content)
-        (target_path / ".env.example").write_text("# Environment variables\n")
-        (target_path / "README.md").write_text(f"# {name}\n\nEVOID project created with `evo new {name}`\n")
-        
-        # Create config.toml
-        config_content = '''# EVOID Project Configuration
+''')
+
+_README_TMPL = Template("# $name\n\nEVOID project created with `evo new $name`\n")
+
+_ENV_EXAMPLE = "# Environment variables\n"
+
+_PROJECT_CONFIG = '''# EVOID Project Configuration
 
 [project]
 name = "default"
@@ -157,11 +109,142 @@ backend = "memory"  # memory, sqlite
 [storage.sqlite]
 path = "data.db"
 '''
+
+_SERVICE_MAIN_TMPL = Template('''"""
+$name Service - Generated by EVOID
+"""
+
+from evoid import service, get, post, delete, Param, Query, Body, Intent, auth, data_io
+
+svc = service("$name") \\
+    .port(8000) \\
+    .build()
+
+@get("/hello")
+async def hello():
+    return {"message": "Hello from $name service!"}
+
+if __name__ == "__main__":
+    svc.run(dev=True)
+''')
+
+_SERVICE_CONFIG_TMPL = Template('''# $name Service Configuration
+
+[service]
+name = "$name"
+port = 8000
+
+[storage]
+backend = "memory"
+
+[caching]
+default_ttl = 300
+enable_fallback = true
+''')
+
+
+def _write_files(files: list[tuple[Path, str]]) -> None:
+    """Write scaffold files concurrently; on slow filesystems each write is a blocking round trip."""
+    with ThreadPoolExecutor(max_workers=min(4, len(files))) as executor:
+        # list() drains the iterator so any write error is raised here
+        list(executor.map(lambda item: item[0].write_text(item[1]), files))
+
+
+class ProjectStatus(str, Enum):
+    """Status of a project"""
+    ACTIVE = "active"
+    INACTIVE = "inactive"
+    CORRUPT = "corrupt"
+
+
+class ServiceStatus(str, Enum):
+    """Status of a service"""
+    INSTALLED = "installed"
+    MISSING_DEPS = "missing_deps"
+    INACTIVE = "inactive"
+
+
+class ProjectManager:
+    """
+    Project Manager - Core logic for managing EVOX projects and services
+    
+    Handles project creation, service management, and dependency resolution
+    without any CLI-specific logic.
+    """
+    
+    def __init__(self, project_root: Path | None = None):
+        self.project_root = project_root or Path.cwd()
+        # Parsed config.toml files keyed by path, tagged with the file's st_mtime_ns
+        self._toml_cache: dict[str, tuple[int, dict[str, Any]]] = {}
+        # Project status tagged with the project root's st_mtime_ns
+        self._status_cache: tuple[int, ProjectStatus] | None = None
+    
+    def invalidate(self) -> None:
+        """Drop all cached configs and status so the next call re-reads the filesystem."""
+        self._toml_cache.clear()
+        self._status_cache = None
+    
+    def create_project(self, name: str, project_path: Path | None = None) -> bool:
+        """
+        Create a new EVOX project with the specified name.
+        
+        Args:
+            name: Name of the project
+            project_path: Path where the project should be created (defaults to current directory)
+            
+        Returns:
+            True if project was created successfully, False otherwise
+        """
+        files = self._prepare_project(name, project_path)
+        if files is None:
+            return False
         
-        (target_path / "config.toml").write_text(config_content)
+        _write_files(files)
+        return True
+    
+    async def create_project_async(self, name: str, project_path: Path | None = None) -> bool:
+        """
+        Async variant of create_project that writes the project files concurrently
+        in worker threads instead of blocking the event loop.
+        
+        Args:
+            name: Name of the project
+            project_path: Path where the project should be created (defaults to current directory)
+            
+        Returns:
+            True if project was created successfully, False otherwise
+        """
+        files = await asyncio.to_thread(self._prepare_project, name, project_path)
+        if files is None:
+            return False
         
+        await asyncio.gather(*(asyncio.to_thread(path.write_text, content) for path, content in files))
         return True
     
+    def _prepare_project(self, name: str, project_path: Path | None) -> list[tuple[Path, str]] | None:
+        """
+        Create the project directory tree and render the project files.
+        
+        Returns:
+            (path, content) pairs still to be written, or None if the project already exists
+        """
+        target_path = project_path or Path.cwd() / name
+        
+        if target_path.exists():
+            logger.warning("Project directory '%s' already exists!", target_path)
+            return None
+        
+        # Create project structure
+        os.makedirs(target_path / "services")
+        os.makedirs(target_path / "plugins")
+        
+        return [
+            (target_path / "pyproject.toml", _PYPROJECT_TMPL.substitute(name=name)),
+            (target_path / ".env.example", _ENV_EXAMPLE),
+            (target_path / "README.md", _README_TMPL.substitute(name=name)),
+            (target_path / "config.toml", _PROJECT_CONFIG),
+        ]
+    
     def create_service(self, name: str, services_path: Path | None = None) -> bool:
         """
         Create a new EVOID service with the specified name.
@@ -177,53 +260,20 @@ path = "data.db"
         service_path = services_path / name
         
         if not services_path.exists():
-            print(f"Error: Services directory '{services_path}' not found.")
+            logger.error("Services directory '%s' not found.", services_path)
             return False
         
         if service_path.exists():
-            print(f"Service directory '{name}' already exists!")
+            logger.warning("Service directory '%s' already exists!", name)
             return False
         
         # Create service structure
         service_path.mkdir(parents=True)
         
-        # Create service template
-        main_py_content = f'''"""
-{name} Service - Generated by EVOID
-"""
-
-from evoid import service, get, post, delete, Param, Query, Body, Intent, auth, data_io
-
-svc = service("{name}") \\
-    .port(8000) \\
-    .build()
-
-@get("/hello")
-async def hello():
-    return {{"message": "Hello from {name} service!"}}
-
-if __name__ == "__main__":
-    svc.run(dev=True)
-'''
-        
-        (service_path / "main.py").write_text(main_py_content)
-        
-        # Create config.toml
-        config_content = f'''# {name} Service Configuration
-
-[service]
-name = "{name}"
-port = 8000
-
-[storage]
-backend = "memory"
-
-[caching]
-default_ttl = 300
-enable_fallback = true
-'''
-        
-        (service_path / "config.toml").write_text(config_content)
+        _write_files([
+            (service_path / "main.py", _SERVICE_MAIN_TMPL.substitute(name=name)),
+            (service_path / "config.toml", _SERVICE_CONFIG_TMPL.substitute(name=name)),
+        ])
         
         return True
     
@@ -234,13 +284,25 @@ enable_fallback = true
         Returns:
             ProjectStatus indicating the state of the project
         """
-        if not (self.project_root / "pyproject.toml").exists():
+        # Creating or removing pyproject.toml/services bumps the root's mtime
+        try:
+            mtime = self.project_root.stat().st_mtime_ns
+        except OSError:
             return ProjectStatus.CORRUPT
         
-        if not (self.project_root / "services").exists():
-            return ProjectStatus.INACTIVE
+        cached = self._status_cache
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        if not (self.project_root / "pyproject.toml").exists():
+            status = ProjectStatus.CORRUPT
+        elif not (self.project_root / "services").exists():
+            status = ProjectStatus.INACTIVE
+        else:
+            status = ProjectStatus.ACTIVE
         
-        return ProjectStatus.ACTIVE
+        self._status_cache = (mtime, status)
+        return status
     
     def list_services(self) -> List[Dict[str, Any]]:
         """
@@ -254,28 +316,52 @@ enable_fallback = true
             return []
         
         services = []
-        for service_dir in services_path.iterdir():
-            if service_dir.is_dir():
-                config_path = service_dir / "config.toml"
-                config = {}
-                
-                if config_path.exists():
-                    try:
-                        with open(config_path, "rb") as f:
-                            config = tomli.load(f)
-                    except Exception:
-                        pass  # Config file is malformed or doesn't exist
-                
-                service_info = {
-                    "name": service_dir.name,
-                    "path": str(service_dir),
-                    "config": config,
-                    "status": self._get_service_status(service_dir.name)
-                }
-                services.append(service_info)
+        # scandir entries carry their type, avoiding a stat per is_dir() check
+        with os.scandir(services_path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    service_dir = Path(entry.path)
+                    service_info = {
+                        "name": entry.name,
+                        "path": entry.path,
+                        "config": self._load_config(service_dir / "config.toml"),
+                        "status": self._get_service_status(entry.name)
+                    }
+                    services.append(service_info)
         
         return services
     
+    def _load_config(self, config_path: Path) -> dict[str, Any]:
+        """
+        Load a config.toml, reusing the cached parse while the file's mtime is unchanged.
+        
+        Args:
+            config_path: Path to the config file
+            
+        Returns:
+            Parsed config, or an empty dict if the file is missing or malformed
+        """
+        try:
+            mtime = config_path.stat().st_mtime_ns
+        except OSError:
+            return {}
+        
+        key = str(config_path)
+        cached = self._toml_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        import tomli
+        
+        try:
+            with open(config_path, "rb") as f:
+                config = tomli.load(f)
+        except Exception:
+            config = {}  # Config file is malformed
+        
+        self._toml_cache[key] = (mtime, config)
+        return config
+    
     def _get_service_status(self, service_name: str) -> ServiceStatus:
         """
         Determine the status of a specific service.
@@ -296,31 +382,38 @@ enable_fallback = true
         if not config_path.exists():
             return ServiceStatus.INACTIVE
         
-        # Check dependencies by trying to import the service
-        try:
-            # Add service path to Python path temporarily
-            service_path_str = str(service_path.absolute())
-            if service_path_str not in sys.path:
-                sys.path.insert(0, service_path_str)
-            
-            # Try to import the main module
-            import importlib.util
-            main_py = service_path / "main.py"
-            if main_py.exists():
-                spec = importlib.util.spec_from_file_location(f"{service_name}_module", main_py)
-                module = importlib.util.module_from_spec(spec)
-                # Don't execute to avoid side effects, just check if it can be parsed
-                spec.loader.exec_module(module)
-            
-            # Remove path from sys.path
-            if service_path_str in sys.path:
-                sys.path.remove(service_path_str)
-                
+        main_py = service_path / "main.py"
+        if not main_py.exists():
             return ServiceStatus.INSTALLED
-        except ImportError:
-            return ServiceStatus.MISSING_DEPS
-        except Exception:
+        
+        # Parse rather than execute main.py: executing it would boot the whole
+        # service (and run arbitrary user code) just to inspect its imports.
+        try:
+            tree = ast.parse(main_py.read_text(), filename=str(main_py))
+        except (SyntaxError, ValueError, OSError):
             return ServiceStatus.INACTIVE
+        
+        for node in tree.body:
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                names = [node.module]
+            else:
+                continue
+            
+            for name in names:
+                # Only the top-level package is probed: find_spec on a dotted
+                # name would import (and execute) its parent packages.
+                top_level = name.partition(".")[0]
+                if (service_path / f"{top_level}.py").exists() or (service_path / top_level).is_dir():
+                    continue
+                try:
+                    if importlib.util.find_spec(top_level) is None:
+                        return ServiceStatus.MISSING_DEPS
+                except (ImportError, ValueError):
+                    return ServiceStatus.MISSING_DEPS
+        
+        return ServiceStatus.INSTALLED
 
 
 # Global project manager instance
@@ -7,20 +7,30 @@ and priority-aware request queuing with intelligent fallback mechanisms.
 """
 
 import asyncio
+import importlib
+import inspect
+import os
+import re
+import sys
+import time
 import uvicorn
-from typing import Any, get_type_hints, Callable
+from hashlib import blake2b
+from typing import Any, ClassVar, get_type_hints, Callable
 from collections.abc import Callable as CallableABC
-from fastapi import FastAPI, APIRouter, Request, HTTPException
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, APIRouter, BackgroundTasks, Request, HTTPException
 from fastapi.responses import JSONResponse
-from functools import wraps
 from pydantic import BaseModel
 from typing import get_origin, get_args
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 
 from ..infrastructure.queue.priority_queue import PriorityLevel, get_priority_queue
-from ..infrastructure.dependency_injection.injector import get_health_registry, get_service_health
+from ..infrastructure.dependency_injection.injector import DEFAULT_HEALTH_CHECK_TTL, get_health_registry, get_service_health
 from ..data.storage.providers.base_provider import BaseProvider
+from ..monitoring.intelligence.environmental_intelligence import (
+    ADMISSION_LEVEL_HEADER, ADMISSION_LOAD_HEADER, SystemStatus, get_current_context_status
+)
 from ..data.intents.intent_system import Intent, get_intent_registry
 from ..infrastructure.lifecycle import on_service_init
 
@@ -29,8 +39,37 @@ from ..utilities.serialization.fury_codec import fury_codec, FuryNotAvailable, s
 from ..mapping.model_mapper import model_mapper, map_models
 from ..communication.message_bus import message_bus, publish_message, subscribe_to_topic
 from ..infrastructure.scheduler.task_scheduler import task_manager, run_in_background, schedule_delayed, schedule_recurring
-from ..utilities.caching.cache_layer import cache_layer, cache_get, cache_set, cached
-from ..monitoring.metrics.performance_tracker import performance_bench, benchmark_latency, benchmark_throughput
+from ..utilities.caching.cache_layer import CacheTier, cache_layer, cache_get, cache_set, cached
+from ..monitoring.metrics.performance_tracker import performance_bench, benchmark_latency, benchmark_throughput, benchmark_serialization
+
+
+# Parsed TOML configs shared by all orchestrators in the process, keyed by
+# absolute path and tagged with (st_mtime_ns, st_size) for invalidation.
+# The last item is the config's database keys, bucketed once at parse time
+_TOML_CACHE: dict[str, tuple[int, int, dict, list[str]]] = {}
+
+# Auto-discovered config file per (cwd, service name), memoized for a short TTL
+_CONFIG_LOCATION_TTL = 5.0
+_CONFIG_LOCATION_CACHE: dict[tuple[str, str], tuple[float, str | None]] = {}
+
+# Positions to turn into '-' for service names: before each inner capital
+# (CamelCase) and at the underscore of '_service'
+_CAMEL_TO_KEBAB = re.compile(r'(?<!^)(?=[A-Z])|_(?=service)')
+
+
+def _database_keys(config: dict) -> list[str]:
+    """Top-level config keys naming a database service (db-*, *-db, *-db-*)"""
+    return [k for k in config if k.startswith("db-") or k.endswith("-db") or "-db-" in k]
+
+
+# Driver name -> module providing it; unknown drivers use the built-in memory driver
+_DRIVER_SPECS: dict[str, str] = {
+    "sqlite": "sqlite3",
+    "postgresql": "asyncpg",
+    "mysql": "aiomysql",
+    "redis": "redis.asyncio",
+    "mongo": "motor.motor_asyncio",
+}
 
 
 class DatabaseServiceOrchestrator:
@@ -51,11 +90,18 @@ class DatabaseServiceOrchestrator:
     - Automatic health checking and failover
     """
     
-    def __init__(self, service_name: str, config=None):
+    # Loaded driver modules, shared by all orchestrators in the process
+    driver_cache: ClassVar[dict[str, Any]] = {}
+    
+    def __init__(self, service_name: str, config=None, init_concurrency: int = 8, init_timeout: float = 10.0):
         self.service_name = service_name
         self.config = config
+        # Max database services initialized at once, and seconds allowed for each
+        self.init_concurrency = init_concurrency
+        self.init_timeout = init_timeout
+        # (config, database keys) for the most recently loaded config file
+        self._db_key_index: tuple[dict, list[str]] | None = None
         self.database_services = {}
-        self.driver_cache = {}
         self.intent_router = None
         self.health_checker = None
         
@@ -73,22 +119,35 @@ class DatabaseServiceOrchestrator:
         config = await self._load_database_config()
         
         # Discover services
-        discovered_services = await self._discover_database_services(config)
+        discovered_services = self._discover_database_services(config)
         
-        # Initialize each service
-        for service_name, service_config in discovered_services.items():
-            try:
-                service = await self._initialize_database_service(
-                    service_name, service_config
+        # Initialize services concurrently, bounded by init_concurrency and
+        # with a per-service timeout so one hanging driver can't stall startup
+        semaphore = asyncio.Semaphore(self.init_concurrency)
+        
+        async def init_service(service_name: str, service_config: dict):
+            service = await self._initialize_database_service(service_name, service_config)
+            # Load required driver
+            await self._load_database_driver(service_config)
+            return service
+        
+        async def init_one(service_name: str, service_config: dict):
+            async with semaphore:
+                return await asyncio.wait_for(
+                    init_service(service_name, service_config), timeout=self.init_timeout
                 )
-                self.database_services[service_name] = service
-                
-                # Load required driver
-                await self._load_database_driver(service_config)
-                
-            except Exception as e:
-                logging.error(f"Failed to initialize database service {service_name}: {e}")
+        
+        names = list(discovered_services)
+        results = await asyncio.gather(
+            *(init_one(name, discovered_services[name]) for name in names),
+            return_exceptions=True,
+        )
+        for service_name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                logging.error(f"Failed to initialize database service {service_name}: {result!r}")
                 # Continue with other services - don't fail completely
+                continue
+            self.database_services[service_name] = result
                 
         # Initialize intent router
         self.intent_router = IntentBasedDatabaseRouter(self.database_services)
@@ -115,31 +174,77 @@ class DatabaseServiceOrchestrator:
     
     async def _discover_config_automatically(self):
         """Auto-discover database configuration from standard locations."""
-        # Look for config.toml in service directory
-        import os
-        from pathlib import Path
+        location = self._find_config_location()
+        if location is not None:
+            return await self._load_config_from_file(location)
+        
+        # No config found - return empty dict (use defaults/fallbacks)
+        return {}
+    
+    def _find_config_location(self) -> str | None:
+        """
+        Return the first existing config file among the standard locations.
+        
+        Each directory involved is listed once with os.scandir instead of
+        stat()-ing every candidate, and the answer is memoized briefly so
+        back-to-back service starts don't repeat the scan.
+        """
+        key = (os.getcwd(), self.service_name)
+        now = time.monotonic()
+        cached = _CONFIG_LOCATION_CACHE.get(key)
+        if cached is not None and now - cached[0] < _CONFIG_LOCATION_TTL:
+            return cached[1]
+        
+        def list_dir(directory: str) -> set[str]:
+            try:
+                with os.scandir(directory) as entries:
+                    return {entry.name for entry in entries}
+            except OSError:
+                return set()
         
-        # Common config locations
+        # Common config locations, in priority order
         config_locations = [
-            f"./config/database_services.toml",
-            f"./{self.service_name}/config.toml",
-            "./config.toml",
-            "./database_config.toml"
+            ("config", "database_services.toml"),
+            (self.service_name, "config.toml"),
+            (".", "config.toml"),
+            (".", "database_config.toml"),
         ]
         
-        for location in config_locations:
-            if os.path.exists(location):
-                return await self._load_config_from_file(location)
+        listings = {".": list_dir(".")}
+        location = None
+        for directory, filename in config_locations:
+            names = listings.get(directory)
+            if names is None:
+                # Only descend into subdirectories that actually exist
+                names = listings[directory] = list_dir(directory) if directory in listings["."] else set()
+            if filename in names:
+                location = os.path.join(".", directory, filename) if directory != "." else f"./{filename}"
+                break
         
-        # No config found - return empty dict (use defaults/fallbacks)
-        return {}
+        _CONFIG_LOCATION_CACHE[key] = (now, location)
+        return location
     
     async def _load_config_from_file(self, file_path: str):
-        """Load configuration from TOML file."""
+        """Load configuration from TOML file, reusing the parse while the file is unchanged."""
         try:
-            import tomli
-            with open(file_path, 'rb') as f:
-                return tomli.load(f)
+            path = os.path.abspath(file_path)
+            st = os.stat(path)
+            cached = _TOML_CACHE.get(path)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                self._db_key_index = (cached[2], cached[3])
+                return cached[2]
+            
+            try:
+                import tomllib
+            except ImportError:
+                import tomli as tomllib
+            # Parsing the whole file from memory is faster than a streamed load()
+            with open(path, 'rb') as f:
+                config = tomllib.loads(f.read().decode())
+            db_keys = _database_keys(config)
+            _TOML_CACHE[path] = (st.st_mtime_ns, st.st_size, config, db_keys)
+            self._db_key_index = (config, db_keys)
+            return config
         except ImportError:
             logging.warning("tomli not available, using default database config")
             return {}
@@ -147,7 +252,7 @@ class DatabaseServiceOrchestrator:
             logging.error(f"Error loading config from {file_path}: {e}")
             return {}
     
-    async def _discover_database_services(self, config: dict):
+    def _discover_database_services(self, config: dict):
         """Discover available database services from configuration."""
         services = {}
         
@@ -155,18 +260,20 @@ class DatabaseServiceOrchestrator:
         if "database-services" in config:
             services.update(config["database-services"])
         
-        # Also check top-level database entries
-        for key, value in config.items():
-            if key.startswith("db-") or "-db" in key:
-                services[key] = value
+        # Also check top-level database entries, reusing the keys bucketed
+        # when this config was loaded from file
+        index = self._db_key_index
+        db_keys = index[1] if index is not None and index[0] is config else _database_keys(config)
+        for key in db_keys:
+            services[key] = config[key]
         
         # If no services found, create default services based on common patterns
         if not services:
-            services = await self._create_default_services()
+            services = self._create_default_services()
             
         return services
     
-    async def _create_default_services(self):
+    def _create_default_services(self):
         """Create default database services when none are configured."""
         return {
             "default-sql": {
@@ -190,15 +297,15 @@ class DatabaseServiceOrchestrator:
         
         # Create service instance based on type
         if service_type == "sql":
-            return await self._create_sql_service(name, config)
+            return self._create_sql_service(name, config)
         elif service_type == "key_value":
-            return await self._create_key_value_service(name, config)
+            return self._create_key_value_service(name, config)
         elif service_type == "nosql":
-            return await self._create_nosql_service(name, config)
+            return self._create_nosql_service(name, config)
         elif service_type == "columnar":
-            return await self._create_columnar_service(name, config)
+            return self._create_columnar_service(name, config)
         elif service_type == "document":
-            return await self._create_document_service(name, config)
+            return self._create_document_service(name, config)
         else:
             # Generic service for unknown types
             return GenericDatabaseService(name, config)
@@ -218,55 +325,43 @@ class DatabaseServiceOrchestrator:
         """Dynamically load required database driver based on intent."""
         driver = service_config.get("driver", "memory")
         
-        if driver in self.driver_cache:
-            return self.driver_cache[driver]
+        cached = self.driver_cache.get(driver)
+        if cached is not None:
+            return cached
         
-        # Load driver dynamically
-        try:
-            if driver == "sqlite":
-                import sqlite3
-                self.driver_cache[driver] = sqlite3
-            elif driver == "postgresql":
-                import asyncpg
-                self.driver_cache[driver] = asyncpg
-            elif driver == "mysql":
-                import aiomysql
-                self.driver_cache[driver] = aiomysql
-            elif driver == "redis":
-                import redis.asyncio as redis
-                self.driver_cache[driver] = redis
-            elif driver == "mongo":
-                import motor.motor_asyncio
-                self.driver_cache[driver] = motor.motor_asyncio
-            else:
-                # Memory driver (built-in)
-                self.driver_cache[driver] = "memory_driver"
-                
-        except ImportError as e:
-            logging.warning(f"Driver {driver} not available: {e}")
-            # Fall back to memory driver
-            self.driver_cache[driver] = "memory_driver"
-            
-        return self.driver_cache[driver]
+        module_name = _DRIVER_SPECS.get(driver)
+        if module_name is None:
+            # Memory driver (built-in)
+            module = "memory_driver"
+        else:
+            try:
+                module = importlib.import_module(module_name)
+            except ImportError as e:
+                logging.warning(f"Driver {driver} not available: {e}")
+                # Fall back to memory driver
+                module = "memory_driver"
+        
+        self.driver_cache[driver] = module
+        return module
     
-    async def _create_sql_service(self, name: str, config: dict):
+    def _create_sql_service(self, name: str, config: dict):
         """Create SQL database service."""
         # Implementation would create appropriate SQL service
         return SQLDatabaseService(name, config)
     
-    async def _create_key_value_service(self, name: str, config: dict):
+    def _create_key_value_service(self, name: str, config: dict):
         """Create key-value database service."""
         return KeyValueDatabaseService(name, config)
     
-    async def _create_nosql_service(self, name: str, config: dict):
+    def _create_nosql_service(self, name: str, config: dict):
         """Create NoSQL database service."""
         return NoSQLDatabaseService(name, config)
     
-    async def _create_columnar_service(self, name: str, config: dict):
+    def _create_columnar_service(self, name: str, config: dict):
         """Create columnar database service."""
         return ColumnarDatabaseService(name, config)
     
-    async def _create_document_service(self, name: str, config: dict):
+    def _create_document_service(self, name: str, config: dict):
         """Create document database service."""
         return DocumentDatabaseService(name, config)
     
@@ -283,7 +378,6 @@ class DatabaseServiceOrchestrator:
                 logging.error(f"Error closing database service: {e}")
                 
         self.database_services.clear()
-        self.driver_cache.clear()
         logging.info(f"Database services cleaned up for {self.service_name}")
 
 
@@ -328,13 +422,35 @@ class DatabaseHealthChecker:
     def __init__(self, services: dict):
         self.services = services
         self.monitoring = False
+        # One pooled client for all HTTP-based probes (Elasticsearch, CouchDB,
+        # REST APIs, ...) so checks reuse keep-alive connections
+        self._http_client = None
     
     async def start_monitoring(self):
         self.monitoring = True
+        if self._http_client is None:
+            import httpx
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=100, max_connections=200, keepalive_expiry=60.0),
+                timeout=httpx.Timeout(5.0),
+            )
         # Implementation would start health checking tasks
+    
+    async def check_http_endpoint(self, url: str) -> bool:
+        """Probe an HTTP health endpoint through the shared connection pool."""
+        if self._http_client is None:
+            return False
+        try:
+            response = await self._http_client.get(url)
+            return response.status_code < 500
+        except Exception:
+            return False
         
     async def stop_monitoring(self):
         self.monitoring = False
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
         # Implementation would stop health checking tasks
 
 
@@ -357,10 +473,13 @@ class ServiceBuilder:
         self.name = name
         self._port = 8000
         self._health_endpoint = "/health"
-        self.app = FastAPI(title=f"Evox Service - {name}")
+        self.app = FastAPI(title=f"Evox Service - {name}", lifespan=self._lifespan)
+        self._dev = False
         self.router = APIRouter()
         self.startup_handlers: list[Callable] = []
         self.shutdown_handlers: list[Callable] = []
+        self._serial_startup_handlers: list[Callable] = []
+        self._serial_shutdown_handlers: list[Callable] = []
         self.background_tasks: list[dict[str, Any]] = []
         
         # Include router in app
@@ -376,6 +495,8 @@ class ServiceBuilder:
         
         # Store service instance for DI access
         self._instance = None
+        # Set once on_service_init has fired for this builder
+        self._initialized = False
         
         # Initialize new feature components
         self._use_fury = False
@@ -396,26 +517,33 @@ class ServiceBuilder:
         """Build and finalize the service"""
         # Register any controllers that were decorated
         self._register_controllers()
-        # Store instance for DI
+        # Store instance for DI; a rebuild of the same service is already registered
+        previous = ServiceBuilder._instances.get(self.name)
         ServiceBuilder._instances[self.name] = self
         
-        # Register with inject system for type-safe injection
-        from ..infrastructure.dependency_injection.injector import HealthAwareInject
-        HealthAwareInject.register_instance(self.name, self)
+        if previous is not self:
+            # Register with inject system for type-safe injection
+            from ..infrastructure.dependency_injection.injector import HealthAwareInject
+            HealthAwareInject.register_instance(self.name, self)
         
-        # Trigger lifecycle event for service initialization
-        import asyncio
-        try:
-            # Run the async lifecycle event in the current event loop if available
-            loop = asyncio.get_running_loop()
-            # Schedule the event to run soon
-            loop.create_task(on_service_init(self.name, self))
-        except RuntimeError:
-            # No event loop running, run it directly
-            asyncio.run(on_service_init(self.name, self))
+        # on_service_init fires from the app lifespan, on the server's loop
+        if self.initialize not in self.startup_handlers:
+            self.startup_handlers.append(self.initialize)
         
         return self
     
+    async def initialize(self):
+        """
+        Trigger the service's on_service_init lifecycle event, once.
+        
+        Runs at application startup; await it directly to initialize a built
+        service without starting a server (e.g. in tests or CLI tools).
+        """
+        if self._initialized:
+            return
+        self._initialized = True
+        await on_service_init(self.name, self)
+    
     @classmethod
     def get_instance(cls, name: str):
         """Get service instance by name"""
@@ -425,6 +553,16 @@ class ServiceBuilder:
         """Register all decorated controllers with the service"""
         global _controller_registry
         
+        # Collect routes on a local router and mount it once at the end,
+        # rather than growing the live router one route at a time
+        staging = APIRouter()
+        # Route intents are gathered here and registered in a single call
+        intent_batch = []
+        # Bound once; these are called for every route
+        registry = get_intent_registry()
+        add_api_route = staging.add_api_route
+        queue_intent = intent_batch.append
+        
         for controller_name, controller_info in _controller_registry.items():
             controller_class = controller_info["class"]
             prefix = controller_info["prefix"]
@@ -438,15 +576,15 @@ class ServiceBuilder:
                 print(f"Warning: Could not instantiate controller {controller_name}: {e}")
                 continue
             
-            # Get all methods with _evoid_methods attribute
-            for attr_name in dir(controller_instance):
-                if attr_name.startswith('_'):
-                    continue
-                    
+            cls_dict = controller_class.__dict__
+            
+            # Methods with _evoid_methods and their prefixed paths were
+            # collected when @Controller ran
+            for attr_name, method_routes in controller_info["routes"]:
                 attr = getattr(controller_instance, attr_name)
-                if callable(attr) and hasattr(attr, '_evoid_methods'):
+                if callable(attr):
                     # Determine if this method is defined in the current class (not inherited)
-                    is_defined_in_current_class = attr_name in controller_class.__dict__
+                    is_defined_in_current_class = attr_name in cls_dict
                     
                     # If inherit_routes is False, only register methods defined in this class
                     if not inherit_routes and not is_defined_in_current_class:
@@ -455,29 +593,25 @@ class ServiceBuilder:
                     # Bind the method to the instance
                     bound_method = attr.__get__(controller_instance, controller_class)
                     
-                    # Check if method needs request parameter
-                    import inspect
-                    sig = inspect.signature(bound_method)
-                    needs_request = 'request' not in sig.parameters
+                    # Methods that don't declare request get one shared wrapper for all their paths
+                    if 'request' not in _parameter_names(getattr(attr, '__func__', attr)):
+                        route_endpoint = _make_request_injector(bound_method)
+                    else:
+                        route_endpoint = bound_method
                     
                     # Register each method
-                    for method_info in attr._evoid_methods:
+                    for method_info, full_paths in method_routes:
                         method = method_info["method"]
-                        paths = method_info["paths"]
+                        methods_list = method_info["methods"]
                         kwargs = method_info["kwargs"]
                         
                         # Extract intent and priority from kwargs
                         intent = kwargs.get('intent')
                         priority = kwargs.get('priority', 'medium')
                         
-                        # Register intent in the registry
-                        for path in paths:
-                            full_path = prefix + path if prefix else path
-                            get_intent_registry().register_route_intent(
-                                full_path, method, 
-                                intent=intent, 
-                                priority=priority
-                            )
+                        # Queue intent registration for each path
+                        for full_path in full_paths:
+                            queue_intent((full_path, method, intent, priority))
                         
                         # Merge common kwargs with method-specific kwargs
                         merged_kwargs = {**common_kwargs, **kwargs}
@@ -488,31 +622,21 @@ class ServiceBuilder:
                         serialization = merged_kwargs.pop('serialization', 'json')
                         
                         # Register for each path
-                        for path in paths:
-                            full_path = prefix + path if prefix else path
-                            
-                            if needs_request:
-                                # Create wrapped method with request injection
-                                original_method = bound_method
-                                
-                                @wraps(original_method)
-                                async def wrapped_method(request: Request, *args, **kwargs):
-                                    kwargs['request'] = request
-                                    return await original_method(*args, **kwargs)
-                                
-                                self.router.add_api_route(
-                                    path=full_path,
-                                    endpoint=wrapped_method,
-                                    methods=[method],
-                                    **merged_kwargs
-                                )
-                            else:
-                                self.router.add_api_route(
-                                    path=full_path,
-                                    endpoint=bound_method,
-                                    methods=[method],
-                                    **merged_kwargs
-                                )
+                        for full_path in full_paths:
+                            add_api_route(
+                                path=full_path,
+                                endpoint=route_endpoint,
+                                methods=methods_list,
+                                **merged_kwargs
+                            )
+        
+        if intent_batch:
+            registry.register_route_intents(intent_batch)
+        
+        if staging.routes:
+            self.app.include_router(staging)
+            # Let /openapi.json be regenerated lazily with the new routes
+            self.app.openapi_schema = None
         
         # Clear the registry after registration
         _controller_registry.clear()
@@ -532,18 +656,12 @@ class ServiceBuilder:
             intent = kwargs.pop('intent', None)
             serialization = kwargs.pop('serialization', 'json')
             
-            try:
-                priority = PriorityLevel[priority_str.upper()]
-            except KeyError:
-                priority = PriorityLevel.MEDIUM  # Default to medium priority
+            priority = PriorityLevel.from_name(priority_str)
             
             # Register intent in the registry
-            for method in methods:
-                get_intent_registry().register_route_intent(
-                    path, method, 
-                    intent=intent, 
-                    priority=priority_str
-                )
+            get_intent_registry().register_route_intents(
+                [(path, method, intent, priority_str) for method in methods]
+            )
             
             # Store priority information for later use
             func._evoid_priority = priority
@@ -563,17 +681,29 @@ class ServiceBuilder:
         self.app.include_router(group_router)
         return group_router
     
-    def on_startup(self, func: Callable[..., Any]):
-        """Register a startup handler"""
-        self.startup_handlers.append(func)
-        self.app.on_event("startup")(func)
-        return func
+    def on_startup(self, func: Callable[..., Any] = None, *, serial: bool = False):
+        """
+        Register a startup handler
+        
+        Handlers run concurrently at startup. Pass serial=True for handlers
+        that must run in registration order; those run before the rest.
+        """
+        def register(func: Callable[..., Any]):
+            (self._serial_startup_handlers if serial else self.startup_handlers).append(func)
+            return func
+        return register if func is None else register(func)
     
-    def on_shutdown(self, func: Callable[..., Any]):
-        """Register a shutdown handler"""
-        self.shutdown_handlers.append(func)
-        self.app.on_event("shutdown")(func)
-        return func
+    def on_shutdown(self, func: Callable[..., Any] = None, *, serial: bool = False):
+        """
+        Register a shutdown handler
+        
+        Handlers run concurrently at shutdown. Pass serial=True for handlers
+        that must run in registration order; those run after the rest.
+        """
+        def register(func: Callable[..., Any]):
+            (self._serial_shutdown_handlers if serial else self.shutdown_handlers).append(func)
+            return func
+        return register if func is None else register(func)
     
     def background_task(self, interval: int) -> 'ServiceBuilder':
         """Decorator for defining background tasks"""
@@ -614,9 +744,6 @@ class ServiceBuilder:
     
     def _add_benchmark_endpoints(self):
         """Add benchmarking endpoints to service"""
-        from fastapi import BackgroundTasks
-        from .benchmarking.performance_bench import benchmark_serialization
-        
         @self.router.get("/benchmark/serialization")
         async def run_serialization_bench(severity: str = "moderate", duration: int = 30):
             """Run serialization benchmark"""
@@ -641,7 +768,7 @@ class ServiceBuilder:
         """Enable automatic model mapping for this service"""
         return self
     
-    def with_database_services(self, config=None):
+    def with_database_services(self, config=None, intent_routing: bool = False):
         """
         Transform service builder into Resource Orchestrator with database service mapping.
         
@@ -652,6 +779,8 @@ class ServiceBuilder:
         Args:
             config: Optional database service configuration
                   Can be a dict, TOML file path, or None (auto-discovery)
+            intent_routing: Install the database intent routing middleware.
+                  Off by default so requests don't pay for an extra middleware hop
         
         Returns:
             self for method chaining
@@ -673,8 +802,9 @@ class ServiceBuilder:
             config=config
         )
         
-        # Enable database-aware middleware
-        self.app.middleware("http")(self._database_intent_middleware)
+        # Database-aware middleware is only installed when routing is requested
+        if intent_routing:
+            self.app.middleware("http")(self._database_intent_middleware)
         
         # Register startup handler for database service discovery
         @self.on_startup
@@ -725,19 +855,14 @@ class ServiceBuilder:
                 concurrency=3
             )
         """
-        try:
-            priority_level = PriorityLevel[priority.upper()]
-        except KeyError:
-            priority_level = PriorityLevel.MEDIUM
-            
+        priority_level = PriorityLevel.from_name(priority)
         queue = get_priority_queue()
         return await queue.gather(*requests, priority=priority_level, concurrency=concurrency)
     
     def run(self, dev: bool = False):
         """Run the service"""
-        # Perform initial health checks on startup
-        if not dev:
-            asyncio.run(self._perform_initial_health_checks())
+        # Initial health checks run in the lifespan, on uvicorn's own loop
+        self._dev = dev
         
         if dev:
             uvicorn.run(
@@ -755,33 +880,84 @@ class ServiceBuilder:
                 log_level="info"
             )
     
-    async def _perform_initial_health_checks(self):
+    @asynccontextmanager
+    async def _lifespan(self, app: FastAPI):
+        """
+        Application lifespan: initial health checks, then the registered
+        startup handlers; shutdown handlers on exit.
+        
+        Independent handlers run concurrently, so startup takes as long as
+        the slowest one rather than the sum of all of them.
+        
+        Running inside the server's event loop keeps connections opened by
+        the checks alive for request serving.
+        """
+        if not self._dev:
+            await self._perform_initial_health_checks()
+        await _run_handlers(self._serial_startup_handlers, serial=True)
+        await _run_handlers(self.startup_handlers)
+        # A custom lifespan replaces Starlette's default one, which is what
+        # normally runs handlers added with app.on_event
+        await app.router.startup()
+        try:
+            yield
+        finally:
+            await app.router.shutdown()
+            await _run_handlers(self.shutdown_handlers)
+            await _run_handlers(self._serial_shutdown_handlers, serial=True)
+    
+    async def _perform_initial_health_checks(self, timeout: float = 5.0, concurrency: int = 20):
         """
         Perform initial health checks on all registered providers during startup.
         
         Rationale: This ensures that all services are aware of the health status
         of their dependencies at startup time, enabling immediate degraded mode
         operations if needed.
+        
+        Checks run concurrently, at most ``concurrency`` at a time. A check
+        that raises or takes longer than ``timeout`` seconds counts as unhealthy.
         """
         logging.info(f"Performing initial health checks for service: {self.name}")
         
         # Get the health registry to check all registered services
         health_registry = get_health_registry()
+        semaphore = asyncio.Semaphore(concurrency)
         
-        # Check health for all registered providers
-        for service_name, health_info in health_registry.items():
-            instance = health_info.get("instance")
-            if instance and isinstance(instance, BaseProvider):
-                is_healthy = await instance.check_health()
-                
-                # Update health registry with new check
-                health_info["is_healthy"] = is_healthy
-                health_info["last_check"] = datetime.now()
-                
-                if not is_healthy:
-                    logging.warning(f"Service '{service_name}' is unhealthy at startup")
-                else:
-                    logging.info(f"Service '{service_name}' is healthy at startup")
+        async def probe(service_name: str, instance: BaseProvider) -> bool:
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(instance.check_health(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    logging.warning(f"Health check for '{service_name}' timed out after {timeout}s")
+                except Exception as e:
+                    logging.error(f"Health check for '{service_name}' failed: {e}")
+                return False
+        
+        # Probe all registered providers together, then record the results
+        providers = [
+            (service_name, health_info, instance)
+            for service_name, health_info in list(health_registry.items())
+            if isinstance(instance := health_info.get("instance"), BaseProvider)
+        ]
+        results = await asyncio.gather(
+            *(probe(service_name, instance) for service_name, _, instance in providers)
+        )
+        
+        # One timestamp for the whole sweep
+        sweep_ts = datetime.now()
+        for (service_name, health_info, _), is_healthy in zip(providers, results):
+            # Update health registry with new check
+            health_info["is_healthy"] = is_healthy
+            health_info["last_check"] = sweep_ts
+            # Injection reuses this result until it expires
+            ttl = timedelta(seconds=getattr(health_info["instance"], "health_check_ttl", DEFAULT_HEALTH_CHECK_TTL))
+            health_info["ttl"] = ttl
+            health_info["cached_until"] = sweep_ts + ttl
+            
+            if not is_healthy:
+                logging.warning(f"Service '{service_name}' is unhealthy at startup")
+            else:
+                logging.info(f"Service '{service_name}' is healthy at startup")
     
     async def _intent_aware_middleware(self, request: Request, call_next):
         """
@@ -790,8 +966,12 @@ class ServiceBuilder:
         Rationale: This middleware intercepts requests before they reach the handler
         and applies intent-aware admission control based on system resource status.
         """
-        # Import intelligence here to avoid circular import
-        from .intelligence import get_current_context_status, SystemStatus
+        # Under normal load every request is admitted, so skip the route lookup
+        system_status = get_current_context_status()
+        if system_status == SystemStatus.GREEN:
+            response = await call_next(request)
+            response.headers[ADMISSION_LEVEL_HEADER] = system_status.value
+            return response
         
         # Get the route information
         path = request.url.path
@@ -803,19 +983,13 @@ class ServiceBuilder:
         route_priority_str = route_info.get("priority", "medium")
         
         # Convert priority string to PriorityLevel enum
-        try:
-            from .queue import PriorityLevel
-            route_priority = PriorityLevel[route_priority_str.upper()]
-        except KeyError:
-            route_priority = PriorityLevel.MEDIUM
-        
-        # Check system status and apply admission control
-        system_status = get_current_context_status()
+        route_priority = PriorityLevel.from_name(route_priority_str)
         
         # Apply intent-aware admission control
-        from .queue import PriorityQueue
         queue = get_priority_queue()
-        is_allowed = queue._is_request_allowed(system_status, route_intent, route_priority, path, method)
+        load = queue.current_load_signal()
+        is_allowed = queue._is_request_allowed(system_status, route_intent, route_priority, path, method, load)
+        admission_headers = {ADMISSION_LEVEL_HEADER: system_status.value, ADMISSION_LOAD_HEADER: f"{load:.3f}"}
         
         if not is_allowed:
             # Log the load shedding event
@@ -825,14 +999,31 @@ class ServiceBuilder:
             )
             return JSONResponse(
                 status_code=503,
-                content={"detail": "Service temporarily unavailable due to high load"}
+                content={"detail": "Service temporarily unavailable due to high load"},
+                headers=admission_headers
             )
         
-        # If request is allowed, proceed with normal processing
+        # If request is allowed, proceed with normal processing; the status
+        # and load ride along so callers can shed before sending the next request
         response = await call_next(request)
+        response.headers.update(admission_headers)
         return response
 
 
+async def _run_handlers(handlers: list[Callable], serial: bool = False):
+    """Run startup/shutdown handlers, sync ones in a worker thread"""
+    def invoke(handler):
+        if inspect.iscoroutinefunction(handler):
+            return handler()
+        return asyncio.to_thread(handler)
+    
+    if serial:
+        for handler in handlers:
+            await invoke(handler)
+    elif handlers:
+        await asyncio.gather(*(invoke(handler) for handler in handlers))
+
+
 # Convenience functions
 def service(name: str) -> ServiceBuilder:
     """Create a new service builder with string name"""
@@ -847,132 +1038,100 @@ def Service(service_type):
     service_name = service_type.__name__ if hasattr(service_type, '__name__') else str(service_type)
     
     # Convert CamelCase to kebab-case for service names
-    import re
-    service_name = re.sub(r'(?<!^)(?=[A-Z])', '-', service_name).lower()
-    service_name = service_name.replace('_service', '-service')
+    service_name = _CAMEL_TO_KEBAB.sub('-', service_name).lower()
     
     # Register the service type with its name for DI
-    from .inject import HealthAwareInject
+    from ..infrastructure.dependency_injection.injector import HealthAwareInject
     HealthAwareInject.register_service(service_type, service_name)
     
     return ServiceBuilder(service_name)
 
 
 # Decorators for endpoints
-def get(path: str, intent: str = None, priority: str = "medium", 
-     serialization: str = "json", **kwargs):
-    """GET endpoint decorator with intent, priority, and serialization support"""
+def _endpoint_decorator(endpoint_info: dict):
+    """Decorator attaching endpoint_info, built once per decoration site, to functions"""
     def decorator(func: Callable[..., Any]):
         # This will be used by ServiceBuilder.endpoint
-        func._evoid_endpoint = {
-            "path": path,
-            "methods": ["GET"],
-            "kwargs": {**kwargs, "intent": intent, "priority": priority, "serialization": serialization}
-        }
+        func._evoid_endpoint = endpoint_info
         return func
     return decorator
 
-def post(path: str, intent: str = None, priority: str = "medium", 
-     serialization: str = "json", **kwargs):
-    """POST endpoint decorator with intent, priority, and serialization support"""
-    def decorator(func: Callable[..., Any]):
-        # This will be used by ServiceBuilder.endpoint
-        func._evoid_endpoint = {
-            "path": path,
-            "methods": ["POST"],
-            "kwargs": {**kwargs, "intent": intent, "priority": priority, "serialization": serialization}
-        }
-        return func
-    return decorator
 
-def put(path: str, intent: str = None, priority: str = "medium", 
-     serialization: str = "json", **kwargs):
-    """PUT endpoint decorator with intent, priority, and serialization support"""
-    def decorator(func: Callable[..., Any]):
-        # This will be used by ServiceBuilder.endpoint
-        func._evoid_endpoint = {
+def _method_decorator(method: str):
+    """Create the endpoint decorator for one HTTP method"""
+    def method_decorator(path: str, intent: str = None, priority: str = "medium", 
+                         serialization: str = "json", **kwargs):
+        return _endpoint_decorator({
             "path": path,
-            "methods": ["PUT"],
+            "methods": [method],
             "kwargs": {**kwargs, "intent": intent, "priority": priority, "serialization": serialization}
-        }
-        return func
-    return decorator
+        })
+    
+    method_decorator.__name__ = method_decorator.__qualname__ = method.lower()
+    method_decorator.__doc__ = f"{method} endpoint decorator with intent, priority, and serialization support"
+    return method_decorator
 
-def delete(path: str, intent: str = None, priority: str = "medium", 
-     serialization: str = "json", **kwargs):
-    """DELETE endpoint decorator with intent, priority, and serialization support"""
-    def decorator(func: Callable[..., Any]):
-        # This will be used by ServiceBuilder.endpoint
-        func._evoid_endpoint = {
-            "path": path,
-            "methods": ["DELETE"],
-            "kwargs": {**kwargs, "intent": intent, "priority": priority, "serialization": serialization}
-        }
-        return func
-    return decorator
 
-def patch(path: str, intent: str = None, priority: str = "medium", 
-     serialization: str = "json", **kwargs):
-    """PATCH endpoint decorator with intent, priority, and serialization support"""
-    def decorator(func: Callable[..., Any]):
-        # This will be used by ServiceBuilder.endpoint
-        func._evoid_endpoint = {
-            "path": path,
-            "methods": ["PATCH"],
-            "kwargs": {**kwargs, "intent": intent, "priority": priority, "serialization": serialization}
-        }
-        return func
-    return decorator
+get, post, put, delete, patch, head, options = (
+    _method_decorator(method)
+    for method in ("GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS")
+)
 
-def head(path: str, intent: str = None, priority: str = "medium", 
-     serialization: str = "json", **kwargs):
-    """HEAD endpoint decorator with intent, priority, and serialization support"""
-    def decorator(func: Callable[..., Any]):
-        # This will be used by ServiceBuilder.endpoint
-        func._evoid_endpoint = {
-            "path": path,
-            "methods": ["HEAD"],
-            "kwargs": {**kwargs, "intent": intent, "priority": priority, "serialization": serialization}
-        }
-        return func
-    return decorator
 
-def options(path: str, intent: str = None, priority: str = "medium", 
-     serialization: str = "json", **kwargs):
-    """OPTIONS endpoint decorator with intent, priority, and serialization support"""
-    def decorator(func: Callable[..., Any]):
-        # This will be used by ServiceBuilder.endpoint
-        func._evoid_endpoint = {
-            "path": path,
-            "methods": ["OPTIONS"],
-            "kwargs": {**kwargs, "intent": intent, "priority": priority, "serialization": serialization}
-        }
-        return func
-    return decorator
+def _get_cached_digest(encoded_path: bytes, args: tuple, kwargs: dict) -> str:
+    """get_cached key for persistent tiers, stable across processes"""
+    # Feed the parts to the hash rather than formatting one string
+    h = blake2b(encoded_path, digest_size=16)
+    h.update(repr(args).encode())
+    h.update(repr(sorted(kwargs.items())).encode())
+    return h.hexdigest()
 
 
 def get_cached(path: str, ttl: int = 300, **kwargs):
     """GET endpoint with automatic caching"""
     def decorator(func):
         original_func = func
+        # cache layers take a timedelta
+        cache_ttl = timedelta(seconds=ttl)
+        encoded_path = path.encode()
         
         async def wrapper(*args, **kwargs):
-            # Generate cache key from request
-            import hashlib
-            cache_key = hashlib.md5(f"{path}{str(args)}{str(sorted(kwargs.items()))}".encode()).hexdigest()
+            # Results are read from and written to the configured tiers
+            # directly: the memory tier is keyed by the arguments themselves,
+            # only persistent tiers (Redis/disk) need the digest
+            layers = cache_layer.layers
+            memory = layers.get(CacheTier.MEMORY)
+            persistent = [layer for tier, layer in layers.items() if tier is not CacheTier.MEMORY]
+            digest = None
+            memory_key = (path, args, tuple(sorted(kwargs.items())))
+            try:
+                hash(memory_key)
+            except TypeError:
+                # Unhashable arguments are keyed by the digest in every tier
+                memory_key = digest = _get_cached_digest(encoded_path, args, kwargs)
             
             # Try cache first
-            from .caching.cache_layer import cache_get
-            cached_result = await cache_get(cache_key)
-            if cached_result is not None:
-                return cached_result
+            if memory is not None:
+                cached_result = await memory.get(memory_key)
+                if cached_result is not None:
+                    return cached_result
+            if persistent and digest is None:
+                digest = _get_cached_digest(encoded_path, args, kwargs)
+            for layer in persistent:
+                cached_result = await layer.get(digest)
+                if cached_result is not None:
+                    if memory is not None:
+                        await memory.set(memory_key, cached_result, cache_ttl)
+                    return cached_result
             
             # Execute original function
             result = await original_func(*args, **kwargs)
             
             # Cache result
-            from .caching.cache_layer import cache_set
-            await cache_set(cache_key, result, ttl)
+            if memory is not None:
+                await memory.set(memory_key, result, cache_ttl)
+            for layer in persistent:
+                await layer.set(digest, result, cache_ttl)
             
             return result
         
@@ -998,14 +1157,11 @@ def endpoint(path: str = None, methods: list[str] = ["GET"], intent: str = None,
         priority: Priority level for this endpoint
         **kwargs: Additional endpoint configuration including priority settings
     """
-    def decorator(func: Callable[..., Any]):
-        func._evoid_endpoint = {
-            "path": path,
-            "methods": methods,
-            "kwargs": {**kwargs, "intent": intent, "priority": priority}
-        }
-        return func
-    return decorator
+    return _endpoint_decorator({
+        "path": path,
+        "methods": methods,
+        "kwargs": {**kwargs, "intent": intent, "priority": priority}
+    })
 
 
 # Type aliases for parameter injection with Pydantic Annotated support
@@ -1022,6 +1178,18 @@ Body = lambda x, default=...: Annotated[x, "body"] if default is ... else Annota
 # Controller decorator for class-based syntax
 _controller_registry = {}
 
+# Parameter names per endpoint function; inspect.signature is costly and the
+# same function is inspected again on every build()
+_SIG_CACHE: dict[Callable, frozenset[str]] = {}
+
+
+def _parameter_names(func: Callable) -> frozenset[str]:
+    """Return the (memoized) parameter names of func"""
+    params = _SIG_CACHE.get(func)
+    if params is None:
+        params = _SIG_CACHE[func] = frozenset(inspect.signature(func).parameters)
+    return params
+
 # Service instances registry
 ServiceBuilder._instances = {}
 
@@ -1037,10 +1205,14 @@ def Controller(prefix: str = "", intent: str = None, priority: str = "medium", i
         **kwargs: Common configuration for all endpoints (cache, auth, etc.)
     """
     def decorator(cls):
+        # Record route methods once, at class-definition time
+        cls._evoid_routes = _collect_route_names(cls)
+        
         # Store controller information for later registration
         controller_info = {
             "class": cls,
             "prefix": prefix,
+            "routes": _plan_routes(cls, prefix),
             "common_kwargs": {**kwargs, "intent": intent, "priority": priority},
             "inherit_routes": inherit_routes
         }
@@ -1049,6 +1221,69 @@ def Controller(prefix: str = "", intent: str = None, priority: str = "medium", i
     return decorator
 
 
+def _make_request_injector(fn: Callable) -> Callable:
+    """
+    Wrap a controller method that doesn't declare ``request`` so FastAPI still
+    hands the wrapper the incoming Request.
+    
+    The request is forwarded to the method only if it accepts ``**kwargs``.
+    The wrapper's signature is the method's own plus ``request``; FastAPI reads it
+    to resolve parameters, so it must not fall through to the wrapped method's.
+    """
+    sig = inspect.signature(fn)
+    params = [
+        p for p in sig.parameters.values()
+        if p.kind not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+    ]
+    forwards_request = any(p.kind is inspect.Parameter.VAR_KEYWORD for p in sig.parameters.values())
+    
+    async def wrapped_method(request: Request, **kwargs):
+        if forwards_request:
+            kwargs['request'] = request
+        return await fn(**kwargs)
+    
+    # Copy only what FastAPI reads (name for the operation id, doc for the
+    # description) instead of functools.wraps' full __dict__ merge
+    wrapped_method.__name__ = fn.__name__
+    wrapped_method.__qualname__ = fn.__qualname__
+    wrapped_method.__doc__ = fn.__doc__
+    wrapped_method.__wrapped__ = fn
+    request_param = inspect.Parameter('request', inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Request)
+    wrapped_method.__signature__ = sig.replace(parameters=[request_param, *params])
+    return wrapped_method
+
+
+def _collect_route_names(cls) -> tuple[str, ...]:
+    """Names of public attributes (own or inherited) decorated with an HTTP method decorator"""
+    attributes: dict[str, Any] = {}
+    for klass in cls.__mro__:
+        for name, value in vars(klass).items():
+            # The most-derived definition wins, as with normal attribute lookup
+            attributes.setdefault(name, value)
+    
+    return tuple(sorted(
+        name for name, value in attributes.items()
+        if not name.startswith('_')
+        and hasattr(getattr(value, '__func__', value), '_evoid_methods')
+    ))
+
+
+def _plan_routes(cls, prefix: str) -> tuple:
+    """
+    Pair each route method of cls with its method infos and their prefixed paths,
+    so registration doesn't rebuild path strings on every build()
+    """
+    routes = []
+    for name in cls._evoid_routes:
+        value = getattr(cls, name)
+        method_routes = tuple(
+            (method_info, tuple(prefix + path if prefix else path for path in method_info["paths"]))
+            for method_info in getattr(value, '__func__', value)._evoid_methods
+        )
+        routes.append((name, method_routes))
+    return tuple(routes)
+
+
 # HTTP method decorators for class-based syntax
 class _MethodDecorator:
     """Base class for HTTP method decorators in class-based syntax"""
@@ -1059,17 +1294,21 @@ class _MethodDecorator:
         self.priority = priority
         self.kwargs = {**kwargs, "intent": intent, "priority": priority}
     
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # HTTP method named by the subclass, computed once per class and
+        # interned so route method comparisons are usually identity checks
+        cls._method_name = sys.intern(cls.__name__.upper())
+    
     def __call__(self, func):
         # Store method information for later registration
-        if not hasattr(func, '_evoid_methods'):
-            func._evoid_methods = []
-        
-        method_info = {
-            "method": self.__class__.__name__.upper(),
+        method = self._method_name
+        func.__dict__.setdefault('_evoid_methods', []).append({
+            "method": method,
+            "methods": [method],
             "paths": self.paths,
             "kwargs": self.kwargs
-        }
-        func._evoid_methods.append(method_info)
+        })
         return func
 
 # Create HTTP method decorators using generator pattern
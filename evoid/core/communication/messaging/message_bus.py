@@ -12,9 +12,13 @@ This module handles:
 - Performance monitoring events
 """
 
-from typing import Any, Callable, Dict, List, Optional, Set, Union, Awaitable
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union, Awaitable
 import asyncio
+import inspect
+import itertools
 import logging
+import time
+from collections import deque
 from datetime import datetime
 from dataclasses import dataclass, field
 import uuid
@@ -38,38 +42,78 @@ class EventBusEventType(Enum):
     ERROR_OCCURRED = "error.occurred"
 
 
-@dataclass
+# Message ids: a per-process random prefix plus a counter, unique without
+# reading the OS random source for every published event
+_MESSAGE_ID_PREFIX = uuid.uuid4().hex
+_message_ids = itertools.count(1)
+
+
+@dataclass(slots=True)
 class EventBusMessage:
     """Internal event message structure"""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=lambda: f"{_MESSAGE_ID_PREFIX}-{next(_message_ids)}")
     type: EventBusEventType = EventBusEventType.LIFECYCLE_STARTUP
     topic: str = ""
     payload: Any = None
-    timestamp: datetime = field(default_factory=datetime.now)
+    # Wall-clock time in ns; the datetime is only built when asked for
+    timestamp_ns: int = field(default_factory=time.time_ns)
     correlation_id: Optional[str] = None
     source: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
     intent: Intent = Intent.STANDARD
+    
+    @property
+    def timestamp(self) -> datetime:
+        """When the message was created"""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
 
 
 class EventBusSubscription:
     """Represents a subscription to an event topic"""
     
-    def __init__(self, topic: str, callback: Callable[[EventBusMessage], Union[None, Awaitable[None]]], subscriber_id: str):
+    __slots__ = ("topic", "callback", "subscriber_id", "created_at", "active", "is_async")
+    
+    def __init__(
+        self,
+        topic: str,
+        callback: Callable[[EventBusMessage], Union[None, Awaitable[None]]],
+        subscriber_id: str,
+        is_async: Optional[bool] = None
+    ):
         self.topic = topic
         self.callback = callback
         self.subscriber_id = subscriber_id
         self.created_at = datetime.now()
         self.active = True
+        # Whether the callback's result must be awaited; detected from the
+        # callback unless given (e.g. a sync callable returning a coroutine)
+        self.is_async = _is_coroutine_callable(callback) if is_async is None else is_async
+
+
+def _is_coroutine_callable(callback: Callable) -> bool:
+    """Whether calling callback returns a coroutine, including objects with async __call__"""
+    return inspect.iscoroutinefunction(callback) or inspect.iscoroutinefunction(
+        getattr(type(callback), "__call__", None)
+    )
 
 
 class InternalEventBus:
     """Internal asynchronous event bus for framework events"""
     
     def __init__(self):
-        self._subscriptions: Dict[str, List[EventBusSubscription]] = {}
+        # Copy-on-write: each topic's tuple is replaced, never mutated, so
+        # delivery can iterate it while subscriptions change
+        self._subscriptions: Dict[str, Tuple[EventBusSubscription, ...]] = {}
+        # topic -> subscriber id -> that subscriber's subscriptions, so
+        # unsubscribe doesn't scan the topic; removed subscriptions are only
+        # deactivated and pruned from the tuple once they are the majority
+        self._sub_index: Dict[str, Dict[str, List[EventBusSubscription]]] = {}
+        self._inactive_counts: Dict[str, int] = {}
         self._topics: Set[str] = set()
-        self._event_queue: asyncio.Queue = asyncio.Queue()
+        # Many publishers, one worker: a deque plus a wakeup event avoids
+        # asyncio.Queue's waiter bookkeeping on every put/get
+        self._event_queue: deque[EventBusMessage] = deque()
+        self._wake = asyncio.Event()
         self._running = False
         self._worker_task: Optional[asyncio.Task] = None
         self.stats = {
@@ -106,18 +150,22 @@ class InternalEventBus:
         self,
         topic: str,
         callback: Callable[[EventBusMessage], Union[None, Awaitable[None]]],
-        subscriber_id: Optional[str] = None
+        subscriber_id: Optional[str] = None,
+        is_async: Optional[bool] = None
     ) -> str:
-        """Subscribe to an event topic"""
+        """
+        Subscribe to an event topic
+        
+        Coroutine functions are awaited on delivery. Pass is_async=True for
+        other callables that return an awaitable.
+        """
         if subscriber_id is None:
             subscriber_id = str(uuid.uuid4())
         
-        subscription = EventBusSubscription(topic, callback, subscriber_id)
-        
-        if topic not in self._subscriptions:
-            self._subscriptions[topic] = []
+        subscription = EventBusSubscription(topic, callback, subscriber_id, is_async)
         
-        self._subscriptions[topic].append(subscription)
+        self._subscriptions[topic] = self._subscriptions.get(topic, ()) + (subscription,)
+        self._sub_index.setdefault(topic, {}).setdefault(subscriber_id, []).append(subscription)
         self._topics.add(topic)
         self.stats["subscriptions_created"] += 1
         
@@ -126,27 +174,30 @@ class InternalEventBus:
     
     def unsubscribe(self, topic: str, subscriber_id: str) -> bool:
         """Unsubscribe from an event topic"""
-        if topic not in self._subscriptions:
+        topic_index = self._sub_index.get(topic)
+        removed_subscriptions = topic_index.pop(subscriber_id, None) if topic_index else None
+        if not removed_subscriptions:
             return False
         
-        subscriptions = self._subscriptions[topic]
-        initial_count = len(subscriptions)
+        for subscription in removed_subscriptions:
+            subscription.active = False
         
-        self._subscriptions[topic] = [
-            sub for sub in subscriptions 
-            if sub.subscriber_id != subscriber_id
-        ]
-        
-        # Clean up empty topic
-        if not self._subscriptions[topic]:
+        if not topic_index:
+            # Clean up empty topic
             del self._subscriptions[topic]
+            del self._sub_index[topic]
+            self._inactive_counts.pop(topic, None)
             self._topics.discard(topic)
+        else:
+            inactive = self._inactive_counts.get(topic, 0) + len(removed_subscriptions)
+            subscriptions = self._subscriptions[topic]
+            if inactive * 2 > len(subscriptions):
+                self._subscriptions[topic] = tuple(sub for sub in subscriptions if sub.active)
+                inactive = 0
+            self._inactive_counts[topic] = inactive
         
-        removed = len(subscriptions) != initial_count
-        if removed:
-            logger.info(f"Subscriber {subscriber_id} unsubscribed from topic '{topic}'")
-        
-        return removed
+        logger.info(f"Subscriber {subscriber_id} unsubscribed from topic '{topic}'")
+        return True
     
     async def publish(
         self,
@@ -169,7 +220,8 @@ class InternalEventBus:
             intent=intent
         )
         
-        await self._event_queue.put(message)
+        self._event_queue.append(message)
+        self._wake.set()
         self.stats["events_published"] += 1
         
         logger.debug(f"Published event to topic '{topic}': {message.id}")
@@ -177,49 +229,65 @@ class InternalEventBus:
     
     async def _process_events(self):
         """Process events from the queue"""
+        queue = self._event_queue
         while self._running:
             try:
-                message = await self._event_queue.get()
+                if not queue:
+                    await self._wake.wait()
+                    self._wake.clear()
                 
-                # Deliver to subscribers
-                await self._deliver_event(message)
-                self.stats["events_consumed"] += 1
+                # Take everything queued so far and deliver it as one batch
+                batch = list(queue)
+                queue.clear()
                 
-                self._event_queue.task_done()
+                try:
+                    await self._deliver_batch(batch)
+                    self.stats["events_consumed"] += len(batch)
+                except Exception as e:
+                    self.stats["errors"] += 1
+                    logger.error(f"Error processing event: {e}")
                 
             except asyncio.CancelledError:
                 break
-            except Exception as e:
-                self.stats["errors"] += 1
-                logger.error(f"Error processing event: {e}")
     
-    async def _deliver_event(self, message: EventBusMessage):
-        """Deliver event to all subscribers of the topic"""
-        if message.topic not in self._subscriptions:
-            return
-        
-        subscriptions = self._subscriptions[message.topic]
+    async def _deliver_batch(self, batch: List[EventBusMessage]):
+        """Deliver a batch of events to the subscribers of their topics"""
+        # Group by topic so each topic's subscribers are looked up once
+        by_topic: Dict[str, List[EventBusMessage]] = {}
+        for message in batch:
+            by_topic.setdefault(message.topic, []).append(message)
         
-        # Deliver to all subscribers concurrently
-        delivery_tasks = []
-        for subscription in subscriptions:
-            if not subscription.active:
+        deliveries = []
+        for topic, messages in by_topic.items():
+            subscriptions = self._subscriptions.get(topic)
+            if not subscriptions:
                 continue
-            task = asyncio.create_task(
+            active = [subscription for subscription in subscriptions if subscription.active]
+            deliveries.extend(
                 self._deliver_to_subscriber(subscription, message)
+                for message in messages
+                for subscription in active
             )
-            delivery_tasks.append(task)
         
-        # Wait for all deliveries
-        if delivery_tasks:
-            await asyncio.gather(*delivery_tasks, return_exceptions=True)
+        # A single delivery (the usual lifecycle-event case) needs no task;
+        # _deliver_to_subscriber already contains the callback's errors
+        if len(deliveries) == 1:
+            await deliveries[0]
+        elif deliveries:
+            # Deliver the whole batch concurrently
+            await asyncio.gather(*deliveries, return_exceptions=True)
     
     async def _deliver_to_subscriber(self, subscription: EventBusSubscription, message: EventBusMessage):
         """Deliver event to a specific subscriber"""
         try:
-            result = subscription.callback(message)
-            if asyncio.iscoroutine(result):
-                await result
+            if subscription.is_async:
+                await subscription.callback(message)
+            else:
+                result = subscription.callback(message)
+                # Sync wrappers (e.g. functools.wraps decorators) around
+                # coroutine functions hide them from detection
+                if inspect.isawaitable(result):
+                    await result
         except Exception as e:
             logger.error(f"Error delivering event to subscriber {subscription.subscriber_id}: {e}")
 
@@ -240,9 +308,13 @@ async def publish_event(
     return await event_bus.publish(topic, payload, event_type, intent=intent, **kwargs)
 
 
-def subscribe_to_events(topic: str, callback: Callable[[EventBusMessage], Union[None, Awaitable[None]]]) -> str:
+def subscribe_to_events(
+    topic: str,
+    callback: Callable[[EventBusMessage], Union[None, Awaitable[None]]],
+    is_async: Optional[bool] = None
+) -> str:
     """Convenience function to subscribe to events"""
-    return event_bus.subscribe(topic, callback)
+    return event_bus.subscribe(topic, callback, is_async=is_async)
 
 
 def get_event_bus():
@@ -250,10 +322,10 @@ def get_event_bus():
     return event_bus
 
 
-def on_event(topic: str, callback: Callable):
+def on_event(topic: str, callback: Callable, is_async: Optional[bool] = None):
     """Decorator to subscribe to events"""
     def decorator(func):
-        event_bus.subscribe(topic, func)
+        event_bus.subscribe(topic, func, is_async=is_async)
         return func
     return decorator
 
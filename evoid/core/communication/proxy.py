@@ -19,11 +19,20 @@ The proxy automatically routes calls between services using the most appropriate
 from typing import Any, Callable
 import httpx
 import asyncio
+import time
 from fastapi import Request
 from pydantic import BaseModel
 
 from ..infrastructure.queue.priority_queue import PriorityLevel, get_priority_queue
 from ..infrastructure.auth.auth_manager import get_auth_manager
+from ..monitoring.intelligence.environmental_intelligence import (
+    ADMISSION_LEVEL_HEADER, ADMISSION_LOAD_HEADER, SystemStatus
+)
+from ..errors.BaseError import ProxyError
+
+# Seconds a downstream's reported admission level is trusted; after that the
+# service is assumed healthy again until its next response says otherwise
+ADMISSION_LEVEL_TTL = 5.0
 
 
 class ServiceProxy:
@@ -67,6 +76,9 @@ class ServiceProxy:
         self._priority_context = {}
         # Schema-based priority boosting
         self._schema_priority_boost = {}
+        # Last admission level and load factor reported by the service, with
+        # its monotonic time; the load is None when the service didn't send it
+        self._admission_level: tuple[SystemStatus, float | None, float] | None = None
     
     def __getattr__(self, method_name: str) -> Callable:
         """
@@ -91,7 +103,19 @@ class ServiceProxy:
                 
                 # Submit to priority queue
                 queue = get_priority_queue()
-                priority_level = PriorityLevel(final_priority)
+                priority_level = PriorityLevel.from_name(final_priority)
+                
+                # Shed locally if the service's last response says it would
+                # reject this, judged by the service's load rather than ours
+                status, load = self._downstream_admission()
+                if status is not SystemStatus.GREEN and not queue._is_request_allowed(
+                    status, None, priority_level, None, None, load
+                ):
+                    raise ProxyError(
+                        f"{self.service_name} is shedding load (status {status.value}); request not sent",
+                        target_service=self.service_name,
+                        error_code="LOAD_SHED"
+                    )
                 
                 return await queue.submit(
                     self._execute_service_call,
@@ -105,6 +129,28 @@ class ServiceProxy:
         
         return proxy_method
     
+    def _downstream_admission(self) -> tuple[SystemStatus, float | None]:
+        """The service's last reported admission level and load, or GREEN once it is stale"""
+        admission_level = self._admission_level
+        if admission_level is None or time.monotonic() - admission_level[2] > ADMISSION_LEVEL_TTL:
+            return SystemStatus.GREEN, None
+        return admission_level[0], admission_level[1]
+    
+    def _record_admission_level(self, response: httpx.Response):
+        """Remember the admission level piggybacked on a response, if any"""
+        value = response.headers.get(ADMISSION_LEVEL_HEADER)
+        if value is None:
+            return
+        try:
+            status = SystemStatus(value)
+        except ValueError:
+            return
+        try:
+            load = float(response.headers[ADMISSION_LOAD_HEADER])
+        except (KeyError, ValueError):
+            load = None
+        self._admission_level = (status, load, time.monotonic())
+    
     def _determine_priority(self, explicit_priority: str | None, args: tuple, kwargs: dict) -> str:
         """
         Determine priority based on context, schema metadata, and requester.
@@ -328,6 +374,8 @@ class ServiceProxy:
                     headers=headers
                 )
             
+            self._record_admission_level(response)
+            
             if response.status_code == 200:
                 return response.json()
             else:
@@ -371,11 +419,8 @@ class ServiceProxy:
         """
         # Submit to priority queue with concurrency control
         queue = get_priority_queue()
-        try:
-            priority_level = PriorityLevel(priority)
-        except ValueError:
-            priority_level = PriorityLevel.MEDIUM
-            
+        priority_level = PriorityLevel.from_name(priority)
+        
         return await queue.gather(
             *calls,
             priority=priority_level,
@@ -343,6 +343,24 @@ def get_intent_from_annotation(annotation) -> Optional[IntentMarker]:
 
 
 # Backward compatibility utilities
+
+# Marker per legacy intent value. Intent and BuiltInDataIntent are str enums,
+# so their members hit the lower-case entries. Markers are shared, like the
+# ones in the Annotated aliases above.
+_LEGACY_MARKERS: Dict[str, IntentMarker] = {
+    "CRITICAL": Critical(),
+    "STANDARD": Standard(),
+    "EPHEMERAL": Ephemeral(),
+    "SENSITIVE": Critical(encrypt=True),
+    "LAZY": Ephemeral(),
+    "critical": Critical(),
+    "standard": Standard(),
+    "ephemeral": Ephemeral(),
+    "sensitive": Critical(encrypt=True),
+    "lazy": Ephemeral(),
+}
+
+
 def map_legacy_intent_to_marker(legacy_intent_value) -> Optional[IntentMarker]:
     """
     Map legacy intent values to new IntentMarker instances.
@@ -355,24 +373,6 @@ def map_legacy_intent_to_marker(legacy_intent_value) -> Optional[IntentMarker]:
     Returns:
         Corresponding IntentMarker or None
     """
-    from .intent_system import Intent  # Avoid circular import
-    
-    intent_mapping = {
-        Intent.CRITICAL: Critical(),
-        Intent.STANDARD: Standard(),
-        Intent.EPHEMERAL: Ephemeral(),
-        Intent.SENSITIVE: Critical(encrypt=True),
-        Intent.LAZY: Ephemeral(),
-        "CRITICAL": Critical(),
-        "STANDARD": Standard(),
-        "EPHEMERAL": Ephemeral(),
-        "SENSITIVE": Critical(encrypt=True),
-        "LAZY": Ephemeral(),
-        "critical": Critical(),
-        "standard": Standard(),
-        "ephemeral": Ephemeral(),
-        "sensitive": Critical(encrypt=True),
-        "lazy": Ephemeral(),
-    }
-    
-    return intent_mapping.get(legacy_intent_value)
\ No newline at end of file
+    if not isinstance(legacy_intent_value, str):
+        return None
+    return _LEGACY_MARKERS.get(legacy_intent_value)
\ No newline at end of file
@@ -20,9 +20,12 @@ Backward Compatibility:
 """
 
 from enum import Enum
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterable, Mapping, Optional, Union
 from pydantic import BaseModel
 from datetime import timedelta
+from functools import lru_cache
+from types import MappingProxyType
+from weakref import WeakKeyDictionary
 
 # Import new modular intent systems
 from .data_intents import (
@@ -33,7 +36,8 @@ from .data_intents import (
 from .operation_intents import (
     OperationIntent, OperationIntentConfig, OperationIntentRegistry,
     OperationIntentDecorator, get_operation_intent_registry,
-    operation_intent, get_endpoint_operation_intent, configure_operation_intent
+    operation_intent, get_endpoint_operation_intent, configure_operation_intent,
+    _route_key
 )
 from .annotated_intents import (
     IntentMarker, extract_annotated_intents, map_legacy_intent_to_marker
@@ -43,6 +47,9 @@ from .annotated_intents import (
 # Backward compatibility alias
 IntentConfig = BaseIntentConfig
 
+# The resolver singleton is created when data_intents is imported
+_resolver = get_intent_resolver()
+
 
 class Intent(str, Enum):
     """
@@ -58,20 +65,42 @@ class Intent(str, Enum):
     SENSITIVE = "sensitive"  # Additional legacy intent
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_config(intent: 'Intent') -> IntentConfig:
-        """Get configuration for intent (backward compatibility)"""
+        """Get configuration for intent (backward compatibility); memoized, shared"""
         # Map legacy intents to new system
-        intent_mapping = {
-            Intent.EPHEMERAL: BuiltInDataIntent.EPHEMERAL,
-            Intent.STANDARD: BuiltInDataIntent.STANDARD,
-            Intent.CRITICAL: BuiltInDataIntent.CRITICAL,
-            Intent.LAZY: BuiltInDataIntent.EPHEMERAL,
-            Intent.SENSITIVE: BuiltInDataIntent.CRITICAL
-        }
-        
-        mapped_intent = intent_mapping.get(intent, BuiltInDataIntent.STANDARD)
-        resolver = get_intent_resolver()
-        return resolver.resolve_intent_config(mapped_intent)
+        mapped_intent = _INTENT_TO_BUILTIN.get(intent, BuiltInDataIntent.STANDARD)
+        return _resolver.resolve_intent_config(mapped_intent)
+
+
+# Legacy intent -> built-in data intent
+_INTENT_TO_BUILTIN = {
+    Intent.EPHEMERAL: BuiltInDataIntent.EPHEMERAL,
+    Intent.STANDARD: BuiltInDataIntent.STANDARD,
+    Intent.CRITICAL: BuiltInDataIntent.CRITICAL,
+    Intent.LAZY: BuiltInDataIntent.EPHEMERAL,
+    Intent.SENSITIVE: BuiltInDataIntent.CRITICAL
+}
+
+# Built-in data intent by value, for plain string declarations
+_STR_TO_BUILTIN = {e.value: e for e in BuiltInDataIntent}
+
+# Operation intent by value, for route intent registration
+_OP_INTENT_BY_VALUE = {e.value: e for e in OperationIntent}
+
+# Score contributed by enum intents in model_intent_score
+_INTENT_WEIGHTS = {
+    BuiltInDataIntent.CRITICAL: 10.0,
+    BuiltInDataIntent.STANDARD: 5.0, 
+    BuiltInDataIntent.EPHEMERAL: 1.0,
+    Intent.CRITICAL: 10.0,
+    Intent.STANDARD: 5.0,
+    Intent.EPHEMERAL: 1.0
+}
+
+
+# Returned by get_route_intent for unknown routes
+_NO_ROUTE_INTENT: "MappingProxyType[str, Any]" = MappingProxyType({})
 
 
 class IntentRegistry:
@@ -83,47 +112,61 @@ class IntentRegistry:
     the same public interface.
     """
     
+    __slots__ = ('_data_intent_registry', '_operation_intent_registry', '_model_intents', '_route_intents')
+    
     def __init__(self):
         self._data_intent_registry = get_data_intent_registry()
         self._operation_intent_registry = get_operation_intent_registry()
-        self._model_intents: dict[type[BaseModel], dict[str, Intent]] = {}
+        # Weak keys so dynamically created models are not kept alive here;
+        # entries go away when the model class is collected
+        self._model_intents: "WeakKeyDictionary[type[BaseModel], dict[str, Intent]]" = WeakKeyDictionary()
+        self._route_intents: dict[str, dict[str, Any]] = {}
     
     def register_route_intent(self, path: str, method: str, intent: Intent = None, priority: str = "medium"):
         """Register route intent (backward compatibility)"""
-        # Map to operation intent if provided
-        if intent:
-            try:
-                op_intent = OperationIntent(intent.value)
-                self._operation_intent_registry.register_endpoint_intent(
-                    path, method, op_intent
-                )
-            except ValueError:
-                # Not a valid operation intent, treat as data intent context
-                pass
+        self.register_route_intents(((path, method, intent, priority),))
+    
+    def register_route_intents(self, entries: Iterable[tuple[str, str, Any, str]]):
+        """
+        Register many route intents in one pass.
         
-        # Store for backward compatibility
-        route_key = f"{method.upper()} {path}"
-        if not hasattr(self, '_route_intents'):
-            self._route_intents = {}
-        self._route_intents[route_key] = {
-            "intent": intent,
-            "priority": priority
-        }
+        Args:
+            entries: (path, method, intent, priority) tuples, as accepted by
+                register_route_intent
+        """
+        route_intents = self._route_intents
+        register_endpoint_intent = self._operation_intent_registry.register_endpoint_intent
+        
+        for path, method, intent, priority in entries:
+            # Map to operation intent if provided; anything else is data
+            # intent context
+            if intent:
+                value = getattr(intent, 'value', intent)
+                op_intent = _OP_INTENT_BY_VALUE.get(value) if isinstance(value, str) else None
+                if op_intent is not None:
+                    register_endpoint_intent(path, method, op_intent)
+            
+            # Store for backward compatibility
+            route_intents[_route_key(path, method)] = {
+                "intent": intent,
+                "priority": priority
+            }
     
     def get_route_intent(self, path: str, method: str) -> dict[str, Any]:
-        """Get route intent information"""
-        route_key = f"{method.upper()} {path}"
+        """Get route intent information (shared; callers must not mutate it)"""
+        route_key = _route_key(path, method)
         
         # Check backward compatibility storage first
-        if hasattr(self, '_route_intents') and route_key in self._route_intents:
-            return self._route_intents[route_key]
+        route_intent = self._route_intents.get(route_key)
+        if route_intent is not None:
+            return route_intent
         
         # Check operation intent registry
         op_intent = self._operation_intent_registry.get_endpoint_intent(path, method)
         if op_intent:
             return op_intent
         
-        return {}
+        return _NO_ROUTE_INTENT
     
     def register_model_intents(self, model_type: type[BaseModel], field_intents: dict[str, Intent]):
         """Register model field intents"""
@@ -148,7 +191,26 @@ def get_intent_registry() -> IntentRegistry:
     return _legacy_intent_registry
 
 
-def extract_intents(model: type[BaseModel]) -> dict[str, Union[Intent, BuiltInDataIntent, str, BaseIntentConfig, IntentMarker]]:
+# Resolved intent config per model class and field name
+_FIELD_CONFIG_CACHE: "WeakKeyDictionary[type[BaseModel], dict[str, Optional[BaseIntentConfig]]]" = WeakKeyDictionary()
+
+# Extracted field intents per model class. Field metadata is fixed once a
+# class is defined; weak keys let dynamically created models be collected.
+_EXTRACT_CACHE: "WeakKeyDictionary[type[BaseModel], MappingProxyType]" = WeakKeyDictionary()
+
+# Intent score per model class; derived only from the cached extraction
+_SCORE_CACHE: "WeakKeyDictionary[type[BaseModel], float]" = WeakKeyDictionary()
+
+
+def _store_intents(model: type[BaseModel], field_intents: dict) -> Mapping:
+    """Freeze extracted intents, register them globally and cache them"""
+    frozen = MappingProxyType(field_intents)
+    _legacy_intent_registry.register_model_intents(model, frozen)
+    _EXTRACT_CACHE[model] = frozen
+    return frozen
+
+
+def extract_intents(model: type[BaseModel]) -> Mapping[str, Union[Intent, BuiltInDataIntent, str, BaseIntentConfig, IntentMarker]]:
     """
     Extract intents from a Pydantic model's field metadata.
     
@@ -159,45 +221,52 @@ def extract_intents(model: type[BaseModel]) -> dict[str, Union[Intent, BuiltInDa
         model: The Pydantic model class to extract intents from
         
     Returns:
-        Dictionary mapping field names to their declared intents
+        Read-only mapping of field names to their declared intents.
+        The result is computed once per model class and shared.
     """
+    cached = _EXTRACT_CACHE.get(model)
+    if cached is not None:
+        return cached
+    
     field_intents = {}
-    resolver = get_intent_resolver()
+    resolver = _resolver
     
     # First, try to extract from Annotated type hints (new system - preferred)
     annotated_intents = extract_annotated_intents(model)
     field_intents.update(annotated_intents)
     
+    # Models fully declared via Annotated have nothing left for the legacy scan
+    fields = model.model_fields
+    if fields.keys() <= field_intents.keys():
+        return _store_intents(model, field_intents)
+    
     # Then, fall back to legacy json_schema_extra for backward compatibility
-    for field_name, field_info in model.model_fields.items():
+    for field_name, field_info in fields.items():
         # Skip if intent already found via Annotated
         if field_name in field_intents:
             continue
             
         intent_declared = None
         
-        # Check for intent in json_schema_extra (legacy support)
-        if hasattr(field_info, 'json_schema_extra') and field_info.json_schema_extra:
-            schema_extra = field_info.json_schema_extra
+        # Check for intent in json_schema_extra (legacy support); it may
+        # also be a callable, which carries no intent
+        schema_extra = getattr(field_info, 'json_schema_extra', None)
+        if schema_extra:
             if isinstance(schema_extra, dict):
-                # Check for intent (legacy)
-                if 'intent' in schema_extra:
-                    intent_declared = schema_extra['intent']
-                # Check for inline config
-                elif 'intent_config' in schema_extra:
-                    # Handle inline configuration
-                    config = schema_extra['intent_config']
-                    if isinstance(config, dict):
-                        resolved_config = resolver.resolve_intent_config(config)
+                # Check for intent (legacy), then for inline config
+                intent_declared = schema_extra.get('intent')
+                if intent_declared is None:
+                    config = schema_extra.get('intent_config')
+                    if type(config) is dict:
                         # Store the resolved intent for this field
-                        field_intents[field_name] = resolved_config
+                        field_intents[field_name] = resolver.resolve_intent_config(config)
                         continue
         
         # Also check older Pydantic extra attribute
-        elif hasattr(field_info, 'extra') and isinstance(field_info.extra, dict):
-            extra = field_info.extra
-            if 'intent' in extra:
-                intent_declared = extra['intent']
+        else:
+            extra = getattr(field_info, 'extra', None)
+            if isinstance(extra, dict):
+                intent_declared = extra.get('intent')
         
         # Process declared intent (legacy)
         if intent_declared is not None:
@@ -208,21 +277,16 @@ def extract_intents(model: type[BaseModel]) -> dict[str, Union[Intent, BuiltInDa
             elif isinstance(intent_declared, (Intent, BuiltInDataIntent)):
                 field_intents[field_name] = intent_declared
             elif isinstance(intent_declared, str):
-                # Try to map to built-in intent first
-                try:
-                    field_intents[field_name] = BuiltInDataIntent(intent_declared.lower())
-                except ValueError:
-                    # Treat as custom intent name
-                    field_intents[field_name] = intent_declared
+                # Try to map to built-in intent first, otherwise treat as
+                # custom intent name
+                mapped = _STR_TO_BUILTIN.get(intent_declared.lower())
+                field_intents[field_name] = mapped if mapped is not None else intent_declared
             elif isinstance(intent_declared, dict):
                 # Inline configuration
                 resolved_config = resolver.resolve_intent_config(intent_declared)
                 field_intents[field_name] = resolved_config
     
-    # Register the extracted intents in the global registry
-    get_intent_registry().register_model_intents(model, field_intents)
-    
-    return field_intents
+    return _store_intents(model, field_intents)
 
 
 def get_intent_config(model: type[BaseModel], field_name: str) -> Optional[BaseIntentConfig]:
@@ -230,6 +294,7 @@ def get_intent_config(model: type[BaseModel], field_name: str) -> Optional[BaseI
     Get the intent configuration for a specific field in a model.
     
     Enhanced version supporting both legacy and new intent systems including Annotated markers.
+    Results are memoized per model and field and shared between callers.
     
     Args:
         model: The Pydantic model class
@@ -238,11 +303,23 @@ def get_intent_config(model: type[BaseModel], field_name: str) -> Optional[BaseI
     Returns:
         BaseIntentConfig for the field, or None if no intent is declared
     """
+    model_configs = _FIELD_CONFIG_CACHE.get(model)
+    if model_configs is not None and field_name in model_configs:
+        return model_configs[field_name]
+    
+    config = None
     intent = get_field_intent(model, field_name)
     if intent:
-        resolver = get_intent_resolver()
-        return resolver.resolve_intent_config(intent)
-    return None
+        config = _resolver.resolve_intent_config(intent)
+        # Plain names may refer to custom intents registered later, so only
+        # intents that resolve the same way forever are cached
+        if isinstance(intent, str) and not isinstance(intent, BuiltInDataIntent):
+            return config
+    
+    if model_configs is None:
+        model_configs = _FIELD_CONFIG_CACHE[model] = {}
+    model_configs[field_name] = config
+    return config
 
 
 def get_field_intent(model: type[BaseModel], field_name: str) -> Union[Intent, BuiltInDataIntent, str, BaseIntentConfig, IntentMarker, None]:
@@ -260,6 +337,50 @@ def get_field_intent(model: type[BaseModel], field_name: str) -> Union[Intent, B
     return intents.get(field_name)
 
 
+# Score added by each enabled config property in model_intent_score
+_CONFIG_FLAG_WEIGHTS = (
+    ('strong_consistency', 5.0),
+    ('encrypt', 5.0),
+    ('audit_logging', 3.0),
+    ('emergency_buffer', 2.0),
+)
+
+
+def _config_score(config: Union[BaseIntentConfig, IntentMarker]) -> float:
+    """Score a config-like intent by the properties it enables"""
+    config_score = 1.0
+    for flag, weight in _CONFIG_FLAG_WEIGHTS:
+        if getattr(config, flag, False):
+            config_score += weight
+    return config_score
+
+
+def _enum_score(intent: Union[Intent, BuiltInDataIntent]) -> float:
+    """Score an enum intent by its weight"""
+    return _INTENT_WEIGHTS.get(intent, 1.0)
+
+
+def _default_score(intent: Any) -> float:
+    """Score a custom intent or string"""
+    return 1.0
+
+
+# Scorer per concrete intent type; other types are resolved on first sight
+_SCORER_BY_TYPE = {Intent: _enum_score, BuiltInDataIntent: _enum_score}
+
+
+def _scorer_for(intent_type: type) -> Any:
+    """Pick and remember the scorer for an intent type not seen before"""
+    if issubclass(intent_type, (Intent, BuiltInDataIntent)):
+        scorer = _enum_score
+    elif issubclass(intent_type, (BaseIntentConfig, IntentMarker)):
+        scorer = _config_score
+    else:
+        scorer = _default_score
+    _SCORER_BY_TYPE[intent_type] = scorer
+    return scorer
+
+
 def model_intent_score(model: type[BaseModel]) -> float:
     """
     Calculate an intent importance score for a model based on its fields.
@@ -272,36 +393,17 @@ def model_intent_score(model: type[BaseModel]) -> float:
     Returns:
         A numerical score representing the overall importance of the model
     """
+    cached = _SCORE_CACHE.get(model)
+    if cached is not None:
+        return cached
+    
     intents = extract_intents(model)
-    resolver = get_intent_resolver()
 
     score = 0.0
     for field_intent in intents.values():
-        if isinstance(field_intent, (Intent, BuiltInDataIntent)):
-            # Map to weights
-            weight_mapping = {
-                BuiltInDataIntent.CRITICAL: 10.0,
-                BuiltInDataIntent.STANDARD: 5.0, 
-                BuiltInDataIntent.EPHEMERAL: 1.0,
-                Intent.CRITICAL: 10.0,
-                Intent.STANDARD: 5.0,
-                Intent.EPHEMERAL: 1.0
-            }
-            score += weight_mapping.get(field_intent, 1.0)
-        elif isinstance(field_intent, (BaseIntentConfig, IntentMarker)):
-            # Score based on config properties
-            config_score = 1.0
-            if hasattr(field_intent, 'strong_consistency') and field_intent.strong_consistency:
-                config_score += 5.0
-            if hasattr(field_intent, 'encrypt') and field_intent.encrypt:
-                config_score += 5.0
-            if hasattr(field_intent, 'audit_logging') and field_intent.audit_logging:
-                config_score += 3.0
-            if hasattr(field_intent, 'emergency_buffer') and field_intent.emergency_buffer:
-                config_score += 2.0
-            score += config_score
-        else:
-            # Custom intent or string
-            score += 1.0
+        intent_type = type(field_intent)
+        scorer = _SCORER_BY_TYPE.get(intent_type) or _scorer_for(intent_type)
+        score += scorer(field_intent)
     
+    _SCORE_CACHE[model] = score
     return score
\ No newline at end of file
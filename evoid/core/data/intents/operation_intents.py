@@ -16,7 +16,7 @@ Core Components:
 from enum import Enum
 from typing import Callable, Dict, Any, Optional, Union
 from dataclasses import dataclass
-from functools import wraps
+from functools import lru_cache, wraps
 
 
 class OperationIntent(str, Enum):
@@ -92,6 +92,12 @@ class OperationIntentConfig:
             self.features = {}
 
 
+@lru_cache(maxsize=1024)
+def _route_key(path: str, method: str) -> str:
+    """Registry key for a route; routes are a small fixed set, so keys are memoized"""
+    return f"{method.upper()} {path}"
+
+
 class OperationIntentRegistry:
     """
     Registry for tracking operation intents across endpoints.
@@ -122,16 +128,14 @@ class OperationIntentRegistry:
         config_override: Optional[Dict[str, Any]] = None
     ):
         """Register operation intent for a specific endpoint"""
-        route_key = f"{method.upper()} {path}"
-        self._endpoint_intents[route_key] = {
+        self._endpoint_intents[_route_key(path, method)] = {
             "intent": intent,
             "config_override": config_override or {}
         }
     
     def get_endpoint_intent(self, path: str, method: str) -> Optional[Dict[str, Any]]:
         """Get operation intent for a specific endpoint"""
-        route_key = f"{method.upper()} {path}"
-        return self._endpoint_intents.get(route_key)
+        return self._endpoint_intents.get(_route_key(path, method))
     
     def register_intent_config(self, intent: OperationIntent, config: OperationIntentConfig):
         """Register custom configuration for an operation intent"""
@@ -13,10 +13,16 @@ Architecture:
 """
 
 import asyncio
+import itertools
 import logging
-from typing import Any, Dict, List, Optional, Type, Union, Callable
+import time
+import weakref
+from hashlib import blake2b
+from collections import OrderedDict, namedtuple
+from typing import Any, Dict, List, Optional, Tuple, Type, Union, Callable
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntEnum
+from functools import lru_cache
 from datetime import datetime
 
 from pydantic import BaseModel
@@ -44,6 +50,40 @@ class OperationType(str, Enum):
     TRANSACTION = "transaction"
 
 
+@dataclass(slots=True)
+class ServiceHealth:
+    """Last known health of a registered database service"""
+    healthy: bool = True
+    last_check: float = 0.0  # time.time() of the check
+    service_type: str = "unknown"
+    error: Optional[str] = None
+
+
+class IntentKind(IntEnum):
+    """Intent categories with a dedicated routing rule; values index the rule table"""
+    CRITICAL = 0
+    STANDARD = 1
+    EPHEMERAL = 2
+    SQL_STORAGE = 3
+    NOSQL_STORAGE = 4
+    CACHE_STORAGE = 5
+    ANALYTICS_STORAGE = 6
+    DOCUMENT_STORAGE = 7
+
+
+@lru_cache(maxsize=1024)
+def _affinity_slot(model_type: Any) -> int:
+    """Stable (cross-process) integer a model is spread across services by"""
+    name = f"{getattr(model_type, '__module__', '')}.{getattr(model_type, '__qualname__', model_type)}"
+    return int.from_bytes(blake2b(name.encode(), digest_size=8).digest(), "big")
+
+
+@lru_cache(maxsize=1024)
+def _intent_kind(intent_name: str) -> Optional[IntentKind]:
+    """Map an intent name (any case) to its IntentKind, or None"""
+    return IntentKind.__members__.get(intent_name.upper())
+
+
 @dataclass
 class RoutingContext:
     """Context information for routing decisions"""
@@ -65,6 +105,30 @@ class RoutingResult:
     routing_metadata: Dict[str, Any]
 
 
+# Fixed routing metadata per strategy; service_type is added per service
+_CRITICAL_METADATA = {"intent": "CRITICAL", "consistency": "STRONG", "durability": "HIGH"}
+_STANDARD_METADATA = {"intent": "STANDARD", "consistency": "EVENTUAL", "durability": "NORMAL"}
+_EPHEMERAL_METADATA = {"intent": "EPHEMERAL", "consistency": "NONE", "durability": "LOW"}
+_READ_METADATA = {"operation": "READ"}
+
+# Service method name per operation type
+_OPERATION_METHODS = {
+    OperationType.CREATE: "write",
+    OperationType.READ: "read",
+    OperationType.UPDATE: "write", 
+    OperationType.DELETE: "delete",
+    OperationType.QUERY: "read",
+    OperationType.TRANSACTION: "execute_transaction"
+}
+
+# Routing decision independent of the data being routed; transform is None
+# when data passes through unchanged
+_RoutingPlan = namedtuple("_RoutingPlan", "service operation_method transform metadata")
+
+# Cached routing plan, the intent it was planned for and its time.monotonic() expiry
+_RoutingCacheEntry = namedtuple("_RoutingCacheEntry", "plan intent expires_at")
+
+
 class IntentRouter:
     """
     Intent-Based Database Router
@@ -80,24 +144,57 @@ class IntentRouter:
     - Performance optimization based on operation patterns
     """
     
-    def __init__(self, service_manager: 'DatabaseServiceManager'):
+    def __init__(
+        self,
+        service_manager: 'DatabaseServiceManager',
+        cache_max_size: int = 4096,
+        cache_ttl: float = 60.0
+    ):
         self.service_manager = service_manager
-        self._routing_cache: Dict[str, RoutingResult] = {}
-        self._intent_routing_rules: Dict[str, Callable] = {}
+        # LRU of routing decisions keyed by (model type, operation, intent key), oldest first
+        self._routing_cache: "OrderedDict[Tuple[Any, OperationType, Any], _RoutingCacheEntry]" = OrderedDict()
+        # Stable ids for unhashable intents, keyed by id() while the intent is alive
+        self._intent_ids: Dict[int, Tuple[weakref.ref, int]] = {}
+        self._intent_id_counter = itertools.count()
+        # Intent marker found on each model class (None when it has none)
+        self._model_intent_cache: "weakref.WeakKeyDictionary[type, Optional[IntentMarker]]" = weakref.WeakKeyDictionary()
+        self._cache_max_size = cache_max_size
+        self._cache_ttl = cache_ttl
+        self._rule_table: Tuple[Callable, ...] = ()
         self._setup_default_routing_rules()
+        service_manager.add_health_listener(self._on_service_health_change)
     
     def _setup_default_routing_rules(self):
-        """Setup default routing rules based on intent types"""
-        self._intent_routing_rules.update({
-            "CRITICAL": self._route_critical_intent,
-            "STANDARD": self._route_standard_intent,
-            "EPHEMERAL": self._route_ephemeral_intent,
-            "SQL_STORAGE": self._route_sql_storage,
-            "NOSQL_STORAGE": self._route_nosql_storage,
-            "CACHE_STORAGE": self._route_cache_storage,
-            "ANALYTICS_STORAGE": self._route_analytics_storage,
-            "DOCUMENT_STORAGE": self._route_document_storage,
-        })
+        """Setup default routing rules based on intent types, in IntentKind order"""
+        self._rule_table = (
+            self._plan_critical_intent,
+            self._plan_standard_intent,
+            self._plan_ephemeral_intent,
+            self._plan_sql_storage,
+            self._plan_nosql_storage,
+            self._plan_cache_storage,
+            self._plan_analytics_storage,
+            self._plan_document_storage,
+        )
+    
+    def route_cached(self, context: RoutingContext) -> Optional[RoutingResult]:
+        """
+        Return the routing for a context if a live cached decision exists.
+        
+        Synchronous, so callers on the hot path can skip awaiting
+        route_operation when the decision is already known.
+        """
+        cache_key = self._generate_cache_key(context)
+        routing_cache = self._routing_cache
+        
+        entry = routing_cache.get(cache_key)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry.expires_at:
+            del routing_cache[cache_key]
+            return None
+        routing_cache.move_to_end(cache_key)
+        return self._result_from_plan(entry.plan, context, entry.intent)
     
     async def route_operation(self, context: RoutingContext) -> RoutingResult:
         """
@@ -109,195 +206,202 @@ class IntentRouter:
         Returns:
             RoutingResult with service and operation details
         """
-        cache_key = self._generate_cache_key(context)
-        
         # Check cache first
-        if cache_key in self._routing_cache:
-            return self._routing_cache[cache_key]
+        result = self.route_cached(context)
+        if result is not None:
+            return result
         
         # Analyze intent from model annotations
         intent_marker = self._extract_intent_from_model(context.model_type)
         if not intent_marker and hasattr(context, 'intent'):
             intent_marker = context.intent
             
-        # Determine routing strategy
+        # Determine and run routing strategy. Planning never awaits, so the
+        # decision is cached before any concurrent identical request can run.
         routing_strategy = self._determine_routing_strategy(intent_marker, context.operation)
+        plan = routing_strategy(context, intent_marker)
         
-        # Execute routing strategy
-        result = await routing_strategy(context, intent_marker)
-        
-        # Cache the result
-        self._routing_cache[cache_key] = result
+        # Cache the plan, evicting the least recently used entry
+        routing_cache = self._routing_cache
+        routing_cache[self._generate_cache_key(context)] = _RoutingCacheEntry(
+            plan, intent_marker, time.monotonic() + self._cache_ttl
+        )
+        if len(routing_cache) > self._cache_max_size:
+            routing_cache.popitem(last=False)
         
-        return result
+        return self._result_from_plan(plan, context, intent_marker)
+    
+    def _result_from_plan(self, plan: '_RoutingPlan', context: RoutingContext, intent: Any) -> RoutingResult:
+        """Build the routing result for this context's data from a routing plan"""
+        data = context.data
+        return RoutingResult(
+            service_name=plan.service.name,
+            service_instance=plan.service,
+            operation_method=plan.operation_method,
+            transformed_data=plan.transform(data, intent) if plan.transform else data,
+            routing_metadata=plan.metadata
+        )
     
     def _extract_intent_from_model(self, model_type: Type[BaseModel]) -> Optional[IntentMarker]:
         """Extract intent information from model annotations"""
+        try:
+            return self._model_intent_cache[model_type]
+        except (KeyError, TypeError):
+            pass
+        
         try:
             field_annotations = get_type_hints(model_type)
-            
-            # Look for intent markers in field annotations
-            for field_name, annotation in field_annotations.items():
-                intent_marker = get_intent_from_annotation(annotation)
-                if intent_marker:
-                    return intent_marker
-                    
-            return None
         except Exception as e:
+            # Not cached: forward references may resolve later
             logger.debug(f"Could not extract intent from model {model_type}: {e}")
             return None
+        
+        # Look for intent markers in field annotations
+        intent_marker = None
+        for field_name, annotation in field_annotations.items():
+            marker = get_intent_from_annotation(annotation)
+            if marker:
+                intent_marker = marker
+                break
+        
+        try:
+            self._model_intent_cache[model_type] = intent_marker
+        except TypeError:
+            # Not weak-referenceable; just skip caching
+            pass
+        return intent_marker
     
     def _determine_routing_strategy(self, intent: Any, operation: OperationType) -> Callable:
         """Determine appropriate routing strategy based on intent and operation"""
-        intent_name = getattr(intent, 'name', str(intent)).upper()
+        intent_name = getattr(intent, 'name', None)
+        if not isinstance(intent_name, str):
+            intent_name = str(intent)
         
         # Check for specific intent routing rule
-        if intent_name in self._intent_routing_rules:
-            return self._intent_routing_rules[intent_name]
+        kind = _intent_kind(intent_name)
+        if kind is not None:
+            return self._rule_table[kind]
         
         # Default routing based on operation type
         if operation == OperationType.READ:
-            return self._route_read_operation
+            return self._plan_read_operation
         elif operation in [OperationType.CREATE, OperationType.UPDATE, OperationType.DELETE]:
-            return self._route_write_operation
+            return self._plan_write_operation
         else:
-            return self._route_generic_operation
+            return self._plan_generic_operation
     
-    async def _route_critical_intent(self, context: RoutingContext, intent: IntentMarker) -> RoutingResult:
+    def _plan_critical_intent(self, context: RoutingContext, intent: IntentMarker) -> _RoutingPlan:
         """Route operations with critical intent (high durability, ACID compliance)"""
         # Find SQL services with strong consistency
-        sql_services = await self.service_manager.get_services_by_type("sql")
-        healthy_sql_services = [s for s in sql_services if await s.check_health()]
+        healthy_sql_services = self.service_manager.get_healthy_services_by_type("sql")
         
         if not healthy_sql_services:
             # Fallback to any healthy service
-            healthy_services = await self.service_manager.get_healthy_services()
+            healthy_services = self.service_manager.get_all_healthy_services()
             if not healthy_services:
                 raise DatabaseError("No healthy database services available for critical operation")
-            service = healthy_services[0]
+            service = self.service_manager.pick_service(healthy_services, context.model_type)
         else:
-            service = healthy_sql_services[0]  # Use first healthy SQL service
+            service = self.service_manager.pick_service(healthy_sql_services, context.model_type)
         
-        return RoutingResult(
-            service_name=service.name,
-            service_instance=service,
+        return _RoutingPlan(
+            service=service,
             operation_method=self._get_operation_method(context.operation, service),
-            transformed_data=self._transform_for_critical_storage(context.data, intent),
-            routing_metadata={
-                "intent": "CRITICAL",
-                "consistency": "STRONG",
-                "durability": "HIGH",
-                "service_type": getattr(service, 'type', 'unknown')
-            }
+            transform=self._transform_for_critical_storage,
+            metadata=self._service_metadata(service, _CRITICAL_METADATA)
         )
     
-    async def _route_standard_intent(self, context: RoutingContext, intent: IntentMarker) -> RoutingResult:
+    def _plan_standard_intent(self, context: RoutingContext, intent: IntentMarker) -> _RoutingPlan:
         """Route operations with standard intent (balanced performance/durability)"""
         # Prefer services that match the intent's storage preference
         preferred_type = getattr(intent, 'storage_engine', 'auto')
         if preferred_type == 'auto':
             preferred_type = 'nosql'  # Default for standard operations
         
-        services = await self.service_manager.get_services_by_type(preferred_type)
-        healthy_services = [s for s in services if await s.check_health()]
+        healthy_services = self.service_manager.get_healthy_services_by_type(preferred_type)
         
         if not healthy_services:
             # Fallback to any healthy service
-            healthy_services = await self.service_manager.get_healthy_services()
+            healthy_services = self.service_manager.get_all_healthy_services()
             if not healthy_services:
                 raise DatabaseError("No healthy database services available")
-            service = healthy_services[0]
+            service = self.service_manager.pick_service(healthy_services, context.model_type)
         else:
-            service = healthy_services[0]
+            service = self.service_manager.pick_service(healthy_services, context.model_type)
         
-        return RoutingResult(
-            service_name=service.name,
-            service_instance=service,
+        return _RoutingPlan(
+            service=service,
             operation_method=self._get_operation_method(context.operation, service),
-            transformed_data=self._transform_for_standard_storage(context.data, intent),
-            routing_metadata={
-                "intent": "STANDARD",
-                "consistency": "EVENTUAL",
-                "durability": "NORMAL",
-                "service_type": getattr(service, 'type', 'unknown')
-            }
+            transform=self._transform_for_standard_storage,
+            metadata=self._service_metadata(service, _STANDARD_METADATA)
         )
     
-    async def _route_ephemeral_intent(self, context: RoutingContext, intent: IntentMarker) -> RoutingResult:
+    def _plan_ephemeral_intent(self, context: RoutingContext, intent: IntentMarker) -> _RoutingPlan:
         """Route operations with ephemeral intent (high performance, low durability)"""
         # Prefer cache/key-value services for ephemeral data
-        cache_services = await self.service_manager.get_services_by_type("key_value")
-        healthy_cache_services = [s for s in cache_services if await s.check_health()]
+        healthy_cache_services = self.service_manager.get_healthy_services_by_type("key_value")
         
         if not healthy_cache_services:
             # Fallback to memory services
-            memory_services = await self.service_manager.get_services_by_type("memory")
-            healthy_memory_services = [s for s in memory_services if await s.check_health()]
+            healthy_memory_services = self.service_manager.get_healthy_services_by_type("memory")
             
             if healthy_memory_services:
-                service = healthy_memory_services[0]
+                service = self.service_manager.pick_service(healthy_memory_services, context.model_type)
             elif healthy_cache_services:
-                service = healthy_cache_services[0]
+                service = self.service_manager.pick_service(healthy_cache_services, context.model_type)
             else:
                 # Last resort: any healthy service
-                healthy_services = await self.service_manager.get_healthy_services()
+                healthy_services = self.service_manager.get_all_healthy_services()
                 if not healthy_services:
                     raise DatabaseError("No healthy database services available for ephemeral operation")
-                service = healthy_services[0]
+                service = self.service_manager.pick_service(healthy_services, context.model_type)
         else:
-            service = healthy_cache_services[0]
+            service = self.service_manager.pick_service(healthy_cache_services, context.model_type)
         
-        return RoutingResult(
-            service_name=service.name,
-            service_instance=service,
+        return _RoutingPlan(
+            service=service,
             operation_method=self._get_operation_method(context.operation, service),
-            transformed_data=self._transform_for_ephemeral_storage(context.data, intent),
-            routing_metadata={
-                "intent": "EPHEMERAL",
-                "consistency": "NONE",
-                "durability": "LOW",
-                "ttl": getattr(intent, 'cache_ttl', None),
-                "service_type": getattr(service, 'type', 'unknown')
-            }
+            transform=self._transform_for_ephemeral_storage,
+            metadata=self._service_metadata(
+                service, _EPHEMERAL_METADATA, ttl=getattr(intent, 'cache_ttl', None)
+            )
         )
     
     # Storage-type specific routing methods
-    async def _route_sql_storage(self, context: RoutingContext, intent: IntentMarker) -> RoutingResult:
+    def _plan_sql_storage(self, context: RoutingContext, intent: IntentMarker) -> _RoutingPlan:
         """Route to SQL storage services"""
-        return await self._route_to_specific_type(context, intent, "sql")
+        return self._plan_to_specific_type(context, intent, "sql")
     
-    async def _route_nosql_storage(self, context: RoutingContext, intent: IntentMarker) -> RoutingResult:
+    def _plan_nosql_storage(self, context: RoutingContext, intent: IntentMarker) -> _RoutingPlan:
         """Route to NoSQL storage services"""
-        return await self._route_to_specific_type(context, intent, "nosql")
+        return self._plan_to_specific_type(context, intent, "nosql")
     
-    async def _route_cache_storage(self, context: RoutingContext, intent: IntentMarker) -> RoutingResult:
+    def _plan_cache_storage(self, context: RoutingContext, intent: IntentMarker) -> _RoutingPlan:
         """Route to cache storage services"""
-        return await self._route_to_specific_type(context, intent, "key_value")
+        return self._plan_to_specific_type(context, intent, "key_value")
     
-    async def _route_analytics_storage(self, context: RoutingContext, intent: IntentMarker) -> RoutingResult:
+    def _plan_analytics_storage(self, context: RoutingContext, intent: IntentMarker) -> _RoutingPlan:
         """Route to analytics/columnar storage services"""
-        return await self._route_to_specific_type(context, intent, "columnar")
+        return self._plan_to_specific_type(context, intent, "columnar")
     
-    async def _route_document_storage(self, context: RoutingContext, intent: IntentMarker) -> RoutingResult:
+    def _plan_document_storage(self, context: RoutingContext, intent: IntentMarker) -> _RoutingPlan:
         """Route to document storage services"""
-        return await self._route_to_specific_type(context, intent, "document")
+        return self._plan_to_specific_type(context, intent, "document")
     
-    async def _route_to_specific_type(self, context: RoutingContext, intent: IntentMarker, service_type: str) -> RoutingResult:
+    def _plan_to_specific_type(self, context: RoutingContext, intent: IntentMarker, service_type: str) -> _RoutingPlan:
         """Generic method to route to specific service type"""
-        services = await self.service_manager.get_services_by_type(service_type)
-        healthy_services = [s for s in services if await s.check_health()]
+        healthy_services = self.service_manager.get_healthy_services_by_type(service_type)
         
         if not healthy_services:
             raise DatabaseError(f"No healthy {service_type} services available")
         
-        service = healthy_services[0]  # Use first healthy service of type
+        service = self.service_manager.pick_service(healthy_services, context.model_type)
         
-        return RoutingResult(
-            service_name=service.name,
-            service_instance=service,
+        return _RoutingPlan(
+            service=service,
             operation_method=self._get_operation_method(context.operation, service),
-            transformed_data=context.data,  # Pass through for specific types
-            routing_metadata={
+            transform=None,  # Pass through for specific types
+            metadata={
                 "intent": getattr(intent, 'name', 'CUSTOM'),
                 "service_type": service_type,
                 "storage_engine": service_type
@@ -305,64 +409,65 @@ class IntentRouter:
         )
     
     # Operation-type routing methods
-    async def _route_read_operation(self, context: RoutingContext, intent: Any) -> RoutingResult:
+    def _plan_read_operation(self, context: RoutingContext, intent: Any) -> _RoutingPlan:
         """Route read operations (prefer faster, eventually consistent services)"""
         # For reads, prefer cache services first, then others
-        cache_services = await self.service_manager.get_services_by_type("key_value")
-        healthy_cache = [s for s in cache_services if await s.check_health()]
+        healthy_cache = self.service_manager.get_healthy_services_by_type("key_value")
         
         if healthy_cache:
-            service = healthy_cache[0]
+            service = self.service_manager.pick_service(healthy_cache, context.model_type)
         else:
             # Fallback to any healthy service
-            healthy_services = await self.service_manager.get_healthy_services()
+            healthy_services = self.service_manager.get_all_healthy_services()
             if not healthy_services:
                 raise DatabaseError("No healthy database services available for read operation")
-            service = healthy_services[0]
+            service = self.service_manager.pick_service(healthy_services, context.model_type)
         
-        return RoutingResult(
-            service_name=service.name,
-            service_instance=service,
+        return _RoutingPlan(
+            service=service,
             operation_method="read",
-            transformed_data=context.data,
-            routing_metadata={"operation": "READ", "service_type": getattr(service, 'type', 'unknown')}
+            transform=None,
+            metadata=self._service_metadata(service, _READ_METADATA)
         )
     
-    async def _route_write_operation(self, context: RoutingContext, intent: Any) -> RoutingResult:
+    def _plan_write_operation(self, context: RoutingContext, intent: Any) -> _RoutingPlan:
         """Route write operations (consider durability and consistency requirements)"""
         # For writes, consider intent requirements
         if hasattr(intent, 'strong_consistency') and intent.strong_consistency:
-            return await self._route_critical_intent(context, intent)
+            return self._plan_critical_intent(context, intent)
         else:
-            return await self._route_standard_intent(context, intent)
+            return self._plan_standard_intent(context, intent)
     
-    async def _route_generic_operation(self, context: RoutingContext, intent: Any) -> RoutingResult:
+    def _plan_generic_operation(self, context: RoutingContext, intent: Any) -> _RoutingPlan:
         """Route generic operations (fallback strategy)"""
-        healthy_services = await self.service_manager.get_healthy_services()
+        healthy_services = self.service_manager.get_all_healthy_services()
         if not healthy_services:
             raise DatabaseError("No healthy database services available")
         
-        service = healthy_services[0]
+        service = self.service_manager.pick_service(healthy_services, context.model_type)
         
-        return RoutingResult(
-            service_name=service.name,
-            service_instance=service,
+        return _RoutingPlan(
+            service=service,
             operation_method=self._get_operation_method(context.operation, service),
-            transformed_data=context.data,
-            routing_metadata={"operation": str(context.operation), "service_type": getattr(service, 'type', 'unknown')}
+            transform=None,
+            metadata=self._service_metadata(
+                service, operation=getattr(context.operation, 'value', context.operation)
+            )
         )
     
     def _get_operation_method(self, operation: OperationType, service: BaseProvider) -> str:
         """Map operation type to service method name"""
-        method_mapping = {
-            OperationType.CREATE: "write",
-            OperationType.READ: "read",
-            OperationType.UPDATE: "write", 
-            OperationType.DELETE: "delete",
-            OperationType.QUERY: "read",
-            OperationType.TRANSACTION: "execute_transaction"
-        }
-        return method_mapping.get(operation, "read")
+        return _OPERATION_METHODS.get(operation, "read")
+    
+    def _service_metadata(self, service: BaseProvider, template: Optional[Dict[str, Any]] = None, **extra) -> Dict[str, Any]:
+        """Build routing metadata from the service's precomputed base plus a per-route template"""
+        base = getattr(service, '_evoid_metadata_base', None)
+        metadata = base.copy() if base is not None else {"service_type": getattr(service, 'type', 'unknown')}
+        if template:
+            metadata.update(template)
+        if extra:
+            metadata.update(extra)
+        return metadata
     
     def _transform_for_critical_storage(self, data: Any, intent: IntentMarker) -> Any:
         """Transform data for critical storage (encryption, validation)"""
@@ -380,19 +485,64 @@ class IntentRouter:
         """Transform data for ephemeral storage (may add TTL, compression)"""
         return data
     
-    def _generate_cache_key(self, context: RoutingContext) -> str:
+    def _generate_cache_key(self, context: RoutingContext) -> Tuple[Any, OperationType, Any]:
         """Generate cache key for routing results"""
-        model_name = context.model_type.__name__ if context.model_type else "unknown"
-        return f"{model_name}_{context.operation}_{hash(str(context.intent))}"
+        return (context.model_type, context.operation, self._intent_key(context.intent))
+    
+    def _intent_key(self, intent: Any) -> Any:
+        """Hashable cache key component for an intent"""
+        if intent is None or isinstance(intent, str):
+            return intent
+        try:
+            hash(intent)
+            return intent
+        except TypeError:
+            pass
+        
+        # Intent markers and configs are mutable dataclasses and unhashable;
+        # give each live instance a stable id
+        intent_ids = self._intent_ids
+        obj_id = id(intent)
+        entry = intent_ids.get(obj_id)
+        if entry is None or entry[0]() is not intent:
+            ref = weakref.ref(intent, lambda _, obj_id=obj_id: intent_ids.pop(obj_id, None))
+            entry = intent_ids[obj_id] = (ref, next(self._intent_id_counter))
+        return entry[1]
     
     def invalidate_cache(self, pattern: Optional[str] = None):
-        """Invalidate routing cache entries"""
+        """
+        Invalidate routing cache entries.
+        
+        Args:
+            pattern: Model class name, operation or string intent to drop
+                entries for; all entries are dropped when omitted
+        """
         if pattern:
-            keys_to_remove = [k for k in self._routing_cache.keys() if pattern in k]
+            keys_to_remove = [
+                k for k in self._routing_cache.keys()
+                if pattern == getattr(k[0], '__name__', None) or pattern == k[1] or pattern == k[2]
+            ]
             for key in keys_to_remove:
                 del self._routing_cache[key]
         else:
             self._routing_cache.clear()
+    
+    def invalidate_service(self, service_name: str):
+        """Invalidate routing cache entries that route to a service"""
+        keys_to_remove = [
+            k for k, entry in self._routing_cache.items()
+            if entry.plan.service.name == service_name
+        ]
+        for key in keys_to_remove:
+            del self._routing_cache[key]
+    
+    def _on_service_health_change(self, service_name: str, healthy: bool):
+        """Drop routings affected by a service changing health"""
+        if healthy:
+            # Cached fallbacks may now have a better target
+            self._routing_cache.clear()
+        else:
+            self.invalidate_service(service_name)
 
 
 class DatabaseServiceManager:
@@ -405,10 +555,12 @@ class DatabaseServiceManager:
     
     def __init__(self):
         self._services: Dict[str, BaseProvider] = {}
-        self._service_health: Dict[str, Dict[str, Any]] = {}
+        self._service_health: Dict[str, ServiceHealth] = {}
         self._service_types: Dict[str, List[str]] = {}
         self._health_check_interval = 30  # seconds
+        self._health_check_timeout = 5  # seconds per service probe
         self._health_check_task: Optional[asyncio.Task] = None
+        self._health_listeners: List[Callable[[str, bool], None]] = []
     
     async def register_service(self, name: str, service: BaseProvider, service_type: str = "generic"):
         """Register a database service"""
@@ -416,13 +568,13 @@ class DatabaseServiceManager:
         if service_type not in self._service_types:
             self._service_types[service_type] = []
         self._service_types[service_type].append(name)
+        # Routing metadata shared by every result routed to this service
+        service._evoid_metadata_base = {"service_type": getattr(service, 'type', 'unknown')}
         
         # Initialize health status
-        self._service_health[name] = {
-            "healthy": True,
-            "last_check": datetime.now(),
-            "type": service_type
-        }
+        self._service_health[name] = ServiceHealth(
+            healthy=True, last_check=time.time(), service_type=service_type
+        )
         
         logger.info(f"Registered database service: {name} ({service_type})")
     
@@ -434,11 +586,58 @@ class DatabaseServiceManager:
         service_names = self._service_types[service_type]
         return [self._services[name] for name in service_names if name in self._services]
     
+    def get_last_check(self, name: str) -> Optional[datetime]:
+        """Time of a service's last health check (registration counts as one)"""
+        health = self._service_health.get(name)
+        if health is None:
+            return None
+        return datetime.fromtimestamp(health.last_check)
+    
+    def pick_service(self, services: List[BaseProvider], model_type: Any) -> BaseProvider:
+        """
+        Pick one of a non-empty list of healthy services for a model.
+        
+        Services of one type are not assumed to be replicas of each other, so
+        every operation on a model (create, read, update, delete) must resolve
+        to the same backend or reads miss what was written. Models are
+        therefore spread across the services by a stable hash of the model
+        class rather than rotated per request; the choice only moves when the
+        set of healthy services changes.
+        
+        Args:
+            services: Candidate services
+            model_type: Model class the operation is for
+        """
+        return services[_affinity_slot(model_type) % len(services)]
+    
+    def add_health_listener(self, listener: Callable[[str, bool], None]):
+        """Register a callback invoked with (name, healthy) when a service changes health"""
+        self._health_listeners.append(listener)
+    
+    def get_healthy_services_by_type(self, service_type: str) -> List[BaseProvider]:
+        """
+        Get services of a specific type that passed their last health check.
+        
+        Reads the status kept by the health monitoring loop, so routing
+        never probes backends itself.
+        """
+        service_health = self._service_health
+        healthy = []
+        for name in self._service_types.get(service_type, ()):
+            health = service_health.get(name)
+            if health is not None and health.healthy and name in self._services:
+                healthy.append(self._services[name])
+        return healthy
+    
     async def get_healthy_services(self) -> List[BaseProvider]:
         """Get all currently healthy services"""
+        return self.get_all_healthy_services()
+    
+    def get_all_healthy_services(self) -> List[BaseProvider]:
+        """Get all services that passed their last health check, without awaiting"""
         healthy_names = [
             name for name, health in self._service_health.items() 
-            if health.get("healthy", False)
+            if health.healthy
         ]
         return [self._services[name] for name in healthy_names if name in self._services]
     
@@ -474,27 +673,75 @@ class DatabaseServiceManager:
                 await asyncio.sleep(5)  # Wait before retrying
     
     async def _perform_health_checks(self):
-        """Perform health checks on all registered services"""
-        for name, service in self._services.items():
-            try:
-                is_healthy = await service.check_health()
-                self._service_health[name] = {
-                    "healthy": is_healthy,
-                    "last_check": datetime.now(),
-                    "type": self._service_health[name].get("type", "unknown")
-                }
+        """Perform health checks on all registered services concurrently"""
+        await asyncio.gather(
+            *(self._probe_one(name, service) for name, service in list(self._services.items())),
+            return_exceptions=True
+        )
+    
+    async def _probe_one(self, name: str, service: BaseProvider):
+        """Health check a single service and record the result"""
+        try:
+            is_healthy = await asyncio.wait_for(
+                service.check_health(), timeout=self._health_check_timeout
+            )
+            self._record_health(name, bool(is_healthy))
+            
+            if not is_healthy:
+                logger.warning(f"Database service {name} is unhealthy")
                 
-                if not is_healthy:
-                    logger.warning(f"Database service {name} is unhealthy")
-                    
-            except Exception as e:
-                logger.error(f"Health check failed for service {name}: {e}")
-                self._service_health[name] = {
-                    "healthy": False,
-                    "last_check": datetime.now(),
-                    "error": str(e),
-                    "type": self._service_health[name].get("type", "unknown")
-                }
+        except Exception as e:
+            logger.error(f"Health check failed for service {name}: {e}")
+            self._record_health(name, False, str(e))
+    
+    def _record_health(self, name: str, is_healthy: bool, error: Optional[str] = None):
+        """Store a health result and notify listeners if the status flipped"""
+        previous = self._service_health.get(name)
+        was_healthy = previous is not None and previous.healthy
+        self._service_health[name] = ServiceHealth(
+            healthy=is_healthy,
+            last_check=time.time(),
+            service_type=previous.service_type if previous is not None else "unknown",
+            error=error
+        )
+        
+        if is_healthy != was_healthy:
+            for listener in self._health_listeners:
+                try:
+                    listener(name, is_healthy)
+                except Exception as e:
+                    logger.error(f"Health listener failed for service {name}: {e}")
+
+
+# Identity fields per model class, see _model_id_fields
+_ID_FIELDS_CACHE: "weakref.WeakKeyDictionary[type, Tuple[str, ...]]" = weakref.WeakKeyDictionary()
+
+
+def _model_id_fields(model_type: Type[BaseModel]) -> Tuple[str, ...]:
+    """
+    Fields identifying instances of a model: __evoid_id_fields__ when
+    declared, else "id" when present, else the first field.
+    """
+    fields = _ID_FIELDS_CACHE.get(model_type)
+    if fields is None:
+        declared = getattr(model_type, '__evoid_id_fields__', None)
+        if declared is not None:
+            fields = tuple(declared)
+        else:
+            model_fields = model_type.model_fields
+            if "id" in model_fields:
+                fields = ("id",)
+            else:
+                fields = tuple(model_fields)[:1]
+        _ID_FIELDS_CACHE[model_type] = fields
+    return fields
+
+
+def _model_key(model: BaseModel) -> str:
+    """Storage key derived from a model's identity fields, stable across processes"""
+    model_type = type(model)
+    identity = (model_type.__name__,) + tuple(getattr(model, f) for f in _model_id_fields(model_type))
+    return blake2b(repr(identity).encode(), digest_size=16).hexdigest()
 
 
 class PersistenceGateway:
@@ -513,12 +760,22 @@ class PersistenceGateway:
         
         # Query with intent-aware optimization
         users = await gateway.query(UserModel).filter(name="John").all()
+    
+    With batch_writes=True, concurrent save() calls are queued and flushed
+    together per service. Services exposing an async
+    write_batch(items: List[Tuple[str, Any]]) receive each flush as one call
+    and should apply it atomically; other services get individual writes.
     """
     
-    def __init__(self):
+    def __init__(self, batch_writes: bool = False, max_batch_size: int = 256):
         self.service_manager = DatabaseServiceManager()
         self.intent_router = IntentRouter(self.service_manager)
         self._initialized = False
+        self._batch_writes = batch_writes
+        self._max_batch_size = max_batch_size
+        # Pending (routing result, key, value, future, model name) saves
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._write_drainer: Optional[asyncio.Task] = None
     
     async def initialize(self, database_services: Optional[Dict[str, BaseProvider]] = None):
         """Initialize the persistence gateway"""
@@ -534,6 +791,10 @@ class PersistenceGateway:
         # Start health monitoring
         await self.service_manager.start_health_monitoring()
         
+        if self._batch_writes:
+            self._write_queue = asyncio.Queue()
+            self._write_drainer = asyncio.create_task(self._drain_writes())
+        
         self._initialized = True
         logger.info("Persistence gateway initialized")
     
@@ -546,22 +807,77 @@ class PersistenceGateway:
             data=model
         )
         
-        routing_result = await self.intent_router.route_operation(context)
+        routing_result = (
+            self.intent_router.route_cached(context)
+            or await self.intent_router.route_operation(context)
+        )
+        key = _model_key(model)
+        
+        if self._write_queue is not None:
+            future = asyncio.get_running_loop().create_future()
+            self._write_queue.put_nowait(
+                (routing_result, key, routing_result.transformed_data, future, type(model).__name__)
+            )
+            return await future
         
         try:
             # Execute the routed operation
             result = await routing_result.service_instance.write(
-                key=str(hash(str(model))),  # Generate key from model
+                key=key,
                 value=routing_result.transformed_data
             )
             return result
         except Exception as e:
-            intercepted_error = intercept_database_error(e, {
-                "operation": "SAVE",
-                "model_type": type(model).__name__,
-                "service": routing_result.service_name
-            })
-            raise intercepted_error
+            raise self._save_error(e, type(model).__name__, routing_result.service_name)
+    
+    def _save_error(self, error: Exception, model_name: str, service_name: str) -> Exception:
+        """Translate a failed save into an EVOX database error"""
+        return intercept_database_error(error, {
+            "operation": "SAVE",
+            "model_type": model_name,
+            "service": service_name
+        })
+    
+    async def _drain_writes(self):
+        """Flush queued saves in batches of whatever has accumulated"""
+        queue = self._write_queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self._max_batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            # Shielded so cancelling the drainer doesn't strand this batch
+            await asyncio.shield(self._flush_writes(batch))
+    
+    async def _flush_writes(self, batch: List[tuple]):
+        """Write a batch of queued saves, one flush per target service"""
+        by_service: Dict[str, List[tuple]] = {}
+        for item in batch:
+            by_service.setdefault(item[0].service_name, []).append(item)
+        await asyncio.gather(*(self._flush_service_writes(items) for items in by_service.values()))
+    
+    async def _flush_service_writes(self, items: List[tuple]):
+        """Write queued saves to one service and resolve their futures"""
+        service = items[0][0].service_instance
+        write_batch = getattr(service, 'write_batch', None)
+        try:
+            if write_batch is not None and len(items) > 1:
+                result = await write_batch([(key, value) for _, key, value, _, _ in items])
+                results = [result] * len(items)
+            else:
+                results = await asyncio.gather(
+                    *(service.write(key=key, value=value) for _, key, value, _, _ in items),
+                    return_exceptions=True
+                )
+        except Exception as e:
+            results = [e] * len(items)
+        
+        for (routing_result, _, _, future, model_name), result in zip(items, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(self._save_error(result, model_name, routing_result.service_name))
+            else:
+                future.set_result(result)
     
     async def get(self, model_type: Type[BaseModel], key: str, intent: Optional[Any] = None) -> Any:
         """Get model by key with intent-aware routing"""
@@ -572,7 +888,10 @@ class PersistenceGateway:
             data={"key": key}
         )
         
-        routing_result = await self.intent_router.route_operation(context)
+        routing_result = (
+            self.intent_router.route_cached(context)
+            or await self.intent_router.route_operation(context)
+        )
         
         try:
             result = await routing_result.service_instance.read(key=key)
@@ -595,7 +914,10 @@ class PersistenceGateway:
             data={"key": key}
         )
         
-        routing_result = await self.intent_router.route_operation(context)
+        routing_result = (
+            self.intent_router.route_cached(context)
+            or await self.intent_router.route_operation(context)
+        )
         
         try:
             result = await routing_result.service_instance.delete(key=key)
@@ -615,6 +937,22 @@ class PersistenceGateway:
     
     async def cleanup(self):
         """Cleanup resources"""
+        if self._write_drainer:
+            self._write_drainer.cancel()
+            try:
+                await self._write_drainer
+            except asyncio.CancelledError:
+                pass
+            self._write_drainer = None
+            
+            # Flush saves still waiting in the queue
+            queue, self._write_queue = self._write_queue, None
+            pending = []
+            while not queue.empty():
+                pending.append(queue.get_nowait())
+            if pending:
+                await self._flush_writes(pending)
+        
         await self.service_manager.stop_health_monitoring()
         self._initialized = False
         logger.info("Persistence gateway cleaned up")
@@ -689,7 +1027,9 @@ async def query_models(model_type: Type[BaseModel], intent: Optional[Any] = None
 
 __all__ = [
     "IntentRouter",
+    "IntentKind",
     "DatabaseServiceManager", 
+    "ServiceHealth",
     "PersistenceGateway",
     "RoutingContext",
     "RoutingResult",
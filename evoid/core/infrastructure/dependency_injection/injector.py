@@ -13,7 +13,7 @@ from typing import TypeVar, Generic, get_origin, get_args, Dict, Any
 
 from functools import wraps
 
-from datetime import datetime
+from datetime import datetime, timedelta
 import contextvars
 import asyncio
 import logging
@@ -40,6 +40,10 @@ _current_request_health_state = contextvars.ContextVar("current_request_health_s
 # Global registry for health states
 _health_registry: dict[str, dict[str, Any]] = {}
 
+# Seconds a provider's health result is reused before it is probed again.
+# Providers can override it with a ``health_check_ttl`` attribute.
+DEFAULT_HEALTH_CHECK_TTL = 60.0
+
 
 class HealthProxy:
     """
@@ -119,17 +123,8 @@ class HealthAwareInject(Generic[T]):
         # Import locally to avoid circular import
         from ...data.storage.providers.base_provider import BaseProvider
         if isinstance(instance, BaseProvider):
-            # Perform health check
-            is_healthy = await instance.check_health()
-            
-            # Update health registry
-            health_state = {
-                "service_name": service_name,
-                "is_healthy": is_healthy,
-                "last_check": datetime.now(),
-                "instance": instance
-            }
-            self.register_health_state(service_name, health_state)
+            # Perform health check, reusing a recent result
+            is_healthy = await cached_check_health(service_name, instance)
             
             if not is_healthy:
                 # Log critical warning about unhealthy dependency
@@ -179,6 +174,45 @@ class HealthAwareInject(Generic[T]):
         
         raise ValueError(f"Cannot resolve dependency from annotation: {annotation}")
 
+async def cached_check_health(service_name: str, instance: "BaseProvider") -> bool:
+    """
+    Check a provider's health, reusing the last result while it is fresh
+    
+    The result is recorded in the health registry and stays valid for the
+    provider's ``health_check_ttl`` seconds (DEFAULT_HEALTH_CHECK_TTL if unset).
+    
+    Args:
+        service_name: Name the provider is registered under
+        instance: The provider to check
+        
+    Returns:
+        True if the provider is healthy, False otherwise
+    """
+    now = datetime.now()
+    health_state = _health_registry.get(service_name)
+    if (
+        health_state is not None
+        and health_state.get("instance") is instance
+        and "cached_until" in health_state
+        and now < health_state["cached_until"]
+    ):
+        return health_state["is_healthy"]
+    
+    is_healthy = await instance.check_health()
+    ttl = timedelta(seconds=getattr(instance, "health_check_ttl", DEFAULT_HEALTH_CHECK_TTL))
+    
+    # Update health registry
+    HealthAwareInject.register_health_state(service_name, {
+        "service_name": service_name,
+        "is_healthy": is_healthy,
+        "last_check": now,
+        "cached_until": now + ttl,
+        "ttl": ttl,
+        "instance": instance
+    })
+    return is_healthy
+
+
 # Global health-aware inject instance
 health_aware_inject = HealthAwareInject()
 
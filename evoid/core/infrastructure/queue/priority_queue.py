@@ -16,6 +16,7 @@ Design Philosophy:
 
 import asyncio
 import heapq
+import random
 from enum import Enum
 from typing import Any, Callable, Coroutine
 from dataclasses import dataclass, field
@@ -23,6 +24,9 @@ from dataclasses import dataclass, field
 import time
 import logging
 from ...data.intents.intent_system import Intent, get_intent_registry
+from ...monitoring.intelligence.environmental_intelligence import (
+    SystemStatus, get_current_context_status, get_last_load_factor
+)
 
 
 class PriorityLevel(Enum):
@@ -35,6 +39,22 @@ class PriorityLevel(Enum):
     LOW = 1
     MEDIUM = 2
     HIGH = 3
+    
+    @classmethod
+    def from_name(cls, name: str) -> "PriorityLevel":
+        """Resolve a priority name ("high", "MEDIUM", ...) case-insensitively, defaulting to MEDIUM"""
+        level = _PRIORITY_BY_NAME.get(name)
+        if level is None:
+            level = _PRIORITY_BY_NAME.get(name.upper(), cls.MEDIUM)
+        return level
+
+
+# Priority name -> PriorityLevel, in both lower and upper case so the common
+# spellings resolve without str.upper() or a KeyError
+_PRIORITY_BY_NAME: dict[str, PriorityLevel] = {
+    **{level.name.lower(): level for level in PriorityLevel},
+    **{level.name: level for level in PriorityLevel},
+}
 
 
 @dataclass
@@ -84,7 +104,7 @@ class PriorityQueue:
     - Integration with intent system for intelligent processing
     """
     
-    def __init__(self, max_concurrent: int = 10):
+    def __init__(self, max_concurrent: int = 10, low_threshold: float = 0.8, high_threshold: float = 0.95):
         self._queue = []
         self._max_concurrent = max_concurrent
         self._current_tasks = 0
@@ -95,6 +115,10 @@ class PriorityQueue:
         self._default_high_priority_concurrency = 5
         self._default_medium_priority_concurrency = 3
         self._default_low_priority_concurrency = 1
+        # Load factors between which sheddable requests are rejected with a
+        # probability rising linearly from 0 to 1 (see _is_request_allowed)
+        self.low_threshold = low_threshold
+        self.high_threshold = high_threshold
     
     async def submit(self, 
                      request_coro: Coroutine[Any, Any, Any], 
@@ -115,14 +139,11 @@ class PriorityQueue:
         Returns:
             Result of the coroutine execution
         """
-        # Import intelligence here to avoid circular import
-        from .intelligence import get_current_context_status, SystemStatus
-        
         # Check system status and apply admission control
         system_status = get_current_context_status()
         
         # Apply intent-aware admission control
-        if not self._is_request_allowed(system_status, intent, priority, path, method):
+        if not self._is_request_allowed(system_status, intent, priority, path, method, self.current_load_signal()):
             # Log the load shedding event
             logging.warning(
                 f"Load shedding: Request to {method} {path} with intent {intent} and priority {priority.name} "
@@ -153,11 +174,12 @@ class PriorityQueue:
         return await self._execute_request(item)
     
     def _is_request_allowed(self,
-                           system_status,  # SystemStatus - import happens inside function
+                           system_status: SystemStatus,
                            intent: Intent | None,
                            priority: PriorityLevel,
                            path: str | None,
-                           method: str | None) -> bool:
+                           method: str | None,
+                           load: float | None) -> bool:
         """
         Determine if a request should be allowed based on system status and intent.
         
@@ -170,13 +192,12 @@ class PriorityQueue:
             priority: Priority level of the request
             path: Path of the request
             method: HTTP method of the request
+            load: Load factor of the system the status belongs to, or None if
+                unknown, in which case every sheddable request is rejected
             
         Returns:
             True if request should be allowed, False otherwise
         """
-        # Import SystemStatus here to avoid forward reference issue
-        from .intelligence import SystemStatus
-        
         # If system is healthy, allow everything
         if system_status == SystemStatus.GREEN:
             return True
@@ -191,12 +212,27 @@ class PriorityQueue:
         # If system is under warning (YELLOW)
         if system_status == SystemStatus.YELLOW:
             # Allow everything except ephemeral or low priority requests
-            return not (intent == Intent.EPHEMERAL or 
-                       priority == PriorityLevel.LOW)
+            if not (intent == Intent.EPHEMERAL or priority == PriorityLevel.LOW):
+                return True
+            # Shed those progressively: the closer the load gets to
+            # high_threshold the more of them are rejected, rather than
+            # all of them as soon as the status turns yellow
+            if load is None:
+                return False
+            if load <= self.low_threshold:
+                return True
+            if load >= self.high_threshold:
+                return False
+            reject_probability = (load - self.low_threshold) / (self.high_threshold - self.low_threshold)
+            return random.random() >= reject_probability
         
         # Default to allowing the request
         return True
     
+    def current_load_signal(self) -> float:
+        """Most recently sampled system load factor (0.0-1.0); takes no new sample"""
+        return get_last_load_factor()
+    
     async def _execute_request(self, item: QueueItem) -> Any:
         """
         Execute a single request with proper resource management.
@@ -283,16 +319,14 @@ class PriorityQueue:
         
         async def limited_request(request_coro):
             async with semaphore:
-                # Import intelligence here to avoid circular import
-                from .intelligence import get_current_context_status, SystemStatus
-                from ...data.intents.intent_system import Intent, get_intent_registry
-                
                 # Check system status and apply admission control
                 system_status = get_current_context_status()
                 
                 # Apply intent-aware admission control
                 # For gather operations, we'll use the default priority
-                if not self._is_request_allowed(system_status, None, priority, "gather", "INTERNAL"):
+                if not self._is_request_allowed(
+                    system_status, None, priority, "gather", "INTERNAL", self.current_load_signal()
+                ):
                     # Log the load shedding event
                     logging.warning(
                         f"Load shedding: Gather request with priority {priority.name} "
@@ -45,6 +45,14 @@ class SystemStatus(str, Enum):
     """System is under critical stress, only critical requests allowed"""
 
 
+# Response header carrying the responding service's SystemStatus value, so
+# callers can shed requests locally instead of sending them to be rejected
+ADMISSION_LEVEL_HEADER = "X-Evox-Admission-Level"
+# Response header carrying the load factor the responding service sheds
+# against, so callers apply its progressive YELLOW rule rather than their own
+ADMISSION_LOAD_HEADER = "X-Evox-Admission-Load"
+
+
 class EnvironmentalIntelligence:
     """
     Environmental Intelligence system that provides automatic context understanding
@@ -225,6 +233,15 @@ class SystemMonitor:
         
         return load_factor
     
+    def get_last_load_factor(self) -> float:
+        """
+        Get the load factor from the most recent sample, without sampling again
+        
+        Returns:
+            Load factor between 0.0 (idle) and 1.0 (maximum load)
+        """
+        return self._cached_load
+    
     def get_system_status(self) -> SystemStatus:
         """
         Get the current system status based on resource utilization.
@@ -276,6 +293,16 @@ def get_environmental_intelligence() -> EnvironmentalIntelligence:
     return _env_intelligence
 
 
+def get_last_load_factor() -> float:
+    """
+    Get the system load factor last sampled by the status/load checks.
+    
+    Returns:
+        Load factor between 0.0 (idle) and 1.0 (maximum load)
+    """
+    return _env_intelligence._system_monitor.get_last_load_factor()
+
+
 def get_current_context_status() -> SystemStatus:
     """
     Get the current system status based on resource utilization.
@@ -385,5 +412,8 @@ __all__ = [
     "understand_requester_context",
     "analyze_schema_intent",
     "SystemStatus",
-    "get_current_context_status"
+    "ADMISSION_LEVEL_HEADER",
+    "ADMISSION_LOAD_HEADER",
+    "get_current_context_status",
+    "get_last_load_factor"
 ]
\ No newline at end of file
@@ -0,0 +1,30 @@
+"""Tests for event delivery on the internal event bus"""
+
+import asyncio
+import functools
+
+from evoid.core.communication.messaging.message_bus import EventBusMessage, InternalEventBus
+
+
+def test_async_handlers_are_awaited():
+    received = []
+
+    class Handler:
+        async def __call__(self, message):
+            received.append(("callable", message.payload))
+
+    async def handle(message):
+        received.append(("wrapped", message.payload))
+
+    @functools.wraps(handle)
+    def wrapper(message):
+        return handle(message)
+
+    async def run():
+        bus = InternalEventBus()
+        bus.subscribe("topic", Handler())
+        bus.subscribe("topic", wrapper)
+        await bus._deliver_batch([EventBusMessage(topic="topic", payload=1)])
+
+    asyncio.run(run())
+    assert sorted(received) == [("callable", 1), ("wrapped", 1)]
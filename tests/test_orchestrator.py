@@ -0,0 +1,31 @@
+"""Tests for service discovery and loading in the orchestrator"""
+
+import sys
+
+import pytest
+
+from evoid.core.application.orchestrator import Orchestrator
+
+
+@pytest.fixture
+def services_dir(tmp_path):
+    """A services directory whose service imports a sibling module relatively"""
+    service_dir = tmp_path / "services" / "relative_users"
+    service_dir.mkdir(parents=True)
+    (service_dir / "models.py").write_text("class User:\n    name = 'user'\n")
+    (service_dir / "main.py").write_text("from .models import User\n")
+    yield tmp_path / "services"
+    for name in list(sys.modules):
+        if name == "evoid_services.relative_users" or name.startswith("evoid_services.relative_users."):
+            del sys.modules[name]
+
+
+def test_service_with_relative_import_loads(services_dir):
+    orchestrator = Orchestrator()
+    orchestrator.discover_services(str(services_dir))
+    
+    module = orchestrator.get_service_module("relative_users")
+    
+    assert module.User.name == "user"
+    assert module.__name__ == "evoid_services.relative_users.main"
+    assert sys.modules["evoid_services.relative_users"].__path__ == [str(services_dir / "relative_users")]
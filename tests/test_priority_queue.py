@@ -0,0 +1,28 @@
+"""Tests for intent-aware admission control in the priority queue"""
+
+from evoid.core.infrastructure.queue.priority_queue import PriorityLevel, PriorityQueue
+from evoid.core.monitoring.intelligence.environmental_intelligence import SystemStatus
+
+
+def admitted(load, attempts=100):
+    queue = PriorityQueue()
+    return sum(
+        queue._is_request_allowed(SystemStatus.YELLOW, None, PriorityLevel.LOW, None, None, load)
+        for _ in range(attempts)
+    )
+
+
+def test_yellow_sheds_low_priority_by_the_given_load():
+    assert admitted(0.5) == 100
+    assert admitted(0.97) == 0
+
+
+def test_yellow_sheds_all_low_priority_when_load_is_unknown():
+    assert admitted(None) == 0
+
+
+def test_priority_names_resolve_case_insensitively():
+    assert PriorityLevel.from_name("high") is PriorityLevel.HIGH
+    assert PriorityLevel.from_name("LOW") is PriorityLevel.LOW
+    assert PriorityLevel.from_name("Medium") is PriorityLevel.MEDIUM
+    assert PriorityLevel.from_name("unknown") is PriorityLevel.MEDIUM
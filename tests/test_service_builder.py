@@ -0,0 +1,54 @@
+"""Tests for the service builder's endpoint decorators"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from evoid.core.application.service_builder import get_cached
+from evoid.core.utilities.caching.cache_layer import CacheTier, DiskCache, MemoryCache, cache_layer
+
+
+@pytest.fixture
+def cache_layers(tmp_path, monkeypatch):
+    """The default memory and disk tiers, with the disk tier under tmp_path"""
+    layers = {
+        CacheTier.MEMORY: MemoryCache(max_size=100),
+        CacheTier.DISK: DiskCache(cache_dir=str(tmp_path / "cache")),
+    }
+    monkeypatch.setattr(cache_layer, "layers", layers)
+    return layers
+
+
+def test_get_cached_serves_repeated_calls_from_cache(cache_layers):
+    calls = []
+
+    @get_cached("/items", ttl=60)
+    async def read_item(item_id):
+        calls.append(item_id)
+        return {"id": item_id}
+
+    async def run():
+        # hash(-1) == hash(-2): the arguments must still get separate entries
+        return [await read_item(-1), await read_item(-2), await read_item(-1)]
+
+    assert asyncio.run(run()) == [{"id": -1}, {"id": -2}, {"id": -1}]
+    assert calls == [-1, -2]
+
+
+def test_get_cached_reads_persistent_tier_after_memory_is_cleared(cache_layers):
+    calls = []
+
+    @get_cached("/items", ttl=60)
+    async def read_item(item_id):
+        calls.append(item_id)
+        return {"id": item_id}
+
+    async def run():
+        await read_item(1)
+        await cache_layers[CacheTier.MEMORY].clear()
+        return await read_item(1)
+
+    assert asyncio.run(run()) == {"id": 1}
+    assert calls == [1]